@@ -1,40 +1,70 @@
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.utils.translation import gettext as _
-from rest_framework import serializers
+from django.utils.translation import gettext_lazy
+from rest_framework import exceptions, serializers, status
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from apps.tasks.cache_utils import cache_safe_get, cache_safe_set
+
+from .utils import (
+    ACTIVE_USER_CACHE_TTL_SECONDS,
+    build_active_user_cache_key,
+    normalize_email,
+)
+
 User = get_user_model()
 
+_HAS_DIGIT = re.compile(r"\d")
+_HAS_ALPHA = re.compile(r"[^\W\d_]")
+# Отсекает только то, что EmailValidator не примет никогда: нет "@", пустые части
+# или пробельные символы в домене. Всё остальное решает полный валидатор.
+_EMAIL_QUICK = re.compile(r".+@[^@\s]+\Z", re.DOTALL)
+
+
+class _PrecheckedEmailField(serializers.EmailField):
+    """EmailField, отсекающий заведомо некорректные адреса до полного валидатора."""
+
+    def to_internal_value(self, data: Any) -> str:
+        value = super().to_internal_value(data)
+        if not _EMAIL_QUICK.match(value):
+            self.fail("invalid")
+        return value
+
+
+class InactiveAccountError(exceptions.APIException):
+    """Вход запрещён: пользователь ещё не подтвердил email."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = gettext_lazy("Учётная запись ещё не активирована. Проверьте почту.")
+    default_code = "inactive"
+
 
 class RegistrationSerializer(serializers.Serializer):
     """Регистрирует нового пользователя и валидирует входные данные."""
 
-    email = serializers.EmailField()
+    email = _PrecheckedEmailField()
     password = serializers.CharField(write_only=True, min_length=8)
     name = serializers.CharField(
         required=False, allow_blank=True, allow_null=True, max_length=255
     )
 
     def validate_email(self, value: str) -> str:
-        """Проверяет, что email ещё не занят."""
-        normalized = value.strip().lower()
-        if User.objects.filter(email__iexact=normalized).exists():
-            raise serializers.ValidationError(
-                _("Пользователь с таким email уже зарегистрирован."), code="duplicate"
-            )
-        return normalized
+        """Нормализует email; уникальность гарантирует ограничение в БД."""
+        return normalize_email(value)
 
     def validate_password(self, value: str) -> str:
         """Убеждается, что пароль содержит буквы и цифры."""
-        if not any(symbol.isdigit() for symbol in value):
+        if not _HAS_DIGIT.search(value):
             raise serializers.ValidationError(
                 _("Пароль должен содержать хотя бы одну цифру."), code="weak_password"
             )
-        if not any(symbol.isalpha() for symbol in value):
+        if not _HAS_ALPHA.search(value):
             raise serializers.ValidationError(
                 _("Пароль должен содержать хотя бы одну букву."), code="weak_password"
             )
@@ -44,12 +74,19 @@ class RegistrationSerializer(serializers.Serializer):
         """Создаёт пользователя в неактивном состоянии."""
         password = validated_data.pop("password")
         name = validated_data.pop("name", None)
-        return User.objects.create_user(
-            password=password,
-            is_active=False,
-            name=name,
-            **validated_data,
-        )
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(
+                    password=password,
+                    is_active=False,
+                    name=name,
+                    **validated_data,
+                )
+        except IntegrityError as exc:
+            raise serializers.ValidationError(
+                {"email": [_("Пользователь с таким email уже зарегистрирован.")]},
+                code="duplicate",
+            ) from exc
 
 
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -63,14 +100,25 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """Дополнительно проверяет статус пользователя перед выдачей токенов."""
         email = attrs.get(self.username_field)
+        self.user_cache = None
         if email:
-            try:
-                user = User.objects.get(email__iexact=email)
-            except User.DoesNotExist:
-                pass
-            else:
-                if not user.is_active:
-                    self.fail("inactive")
+            normalized = normalize_email(email)
+            cache_key = build_active_user_cache_key(normalized)
+            # Кешируем только активных: активация не требует инвалидации,
+            # а деактивированных всё равно отсеет аутентификация SimpleJWT.
+            if cache_safe_get(cache_key) is None:
+                user = (
+                    User.objects.only("id", "email", "is_active")
+                    .filter(email__lower=normalized)
+                    .first()
+                )
+                if user is not None:
+                    if not user.is_active:
+                        raise InactiveAccountError(self.error_messages["inactive"])
+                    cache_safe_set(
+                        cache_key, user.pk, timeout=ACTIVE_USER_CACHE_TTL_SECONDS
+                    )
+                self.user_cache = user
 
         return super().validate(attrs)
 
@@ -78,7 +126,7 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
 class ResendConfirmationSerializer(serializers.Serializer):
     """Повторная отправка письма с подтверждением email."""
 
-    email = serializers.EmailField()
+    email = _PrecheckedEmailField()
 
     default_error_messages = {
         "not_found": _("Пользователь с указанным email не найден."),
@@ -86,9 +134,11 @@ class ResendConfirmationSerializer(serializers.Serializer):
     }
 
     def validate_email(self, value: str) -> str:
-        normalized = value.strip().lower()
+        normalized = normalize_email(value)
         try:
-            user = User.objects.get(email__iexact=normalized)
+            user = User.objects.only("id", "email", "name", "is_active").get(
+                email__lower=normalized
+            )
         except User.DoesNotExist as exc:
             raise serializers.ValidationError(
                 self.error_messages["not_found"], code="not_found"
@@ -1,18 +1,80 @@
 from __future__ import annotations
 
+import os
+import threading
+from smtplib import SMTPServerDisconnected
+
 from celery import shared_task
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 
 from apps.users.models import User
 
+# Соединение принадлежит процессу воркера; SMTP-сессию нельзя вести из нескольких
+# потоков сразу, поэтому отправка целиком идёт под блокировкой.
+_connection_lock = threading.Lock()
+_connection: BaseEmailBackend | None = None
+_connection_backend: str | None = None
+_connection_pid: int | None = None
+
+
+def _get_connection() -> BaseEmailBackend:
+    """Возвращает почтовое соединение процесса; вызывается под ``_connection_lock``."""
+    global _connection, _connection_backend, _connection_pid
+    backend = settings.EMAIL_BACKEND
+    pid = os.getpid()
+    if _connection_pid != pid:
+        # Соединение унаследовано от родителя при fork: сокет ему не принадлежит.
+        _connection = None
+        _connection_backend = None
+    if _connection is None or _connection_backend != backend:
+        _reset_connection()
+        _connection = get_connection(backend)
+        _connection.open()
+        _connection_backend = backend
+        _connection_pid = pid
+    return _connection
+
+
+def _reset_connection() -> None:
+    """Закрывает соединение, чтобы следующая отправка открыла новое."""
+    global _connection, _connection_backend
+    if _connection is not None:
+        try:
+            _connection.close()
+        except Exception:
+            pass
+    _connection = None
+    _connection_backend = None
+
 
 @shared_task
 def send_confirmation_email_async(user_id: int) -> str:
     """Отправляет письмо с подтверждением регистрации через Celery."""
     from .emails import send_confirmation_email
 
-    user = User.objects.filter(pk=user_id).first()
-    if user is None:
+    try:
+        user = User.objects.only("id", "email", "name").get(pk=user_id)
+    except User.DoesNotExist:
         return "user_missing"
 
-    send_confirmation_email(user)
+    with _connection_lock:
+        try:
+            send_confirmation_email(
+                user.pk, user.email, user.name, connection=_get_connection()
+            )
+        except (SMTPServerDisconnected, ConnectionError):
+            # Сервер закрыл простаивающее соединение: повторяем один раз на новом.
+            _reset_connection()
+            try:
+                send_confirmation_email(
+                    user.pk, user.email, user.name, connection=_get_connection()
+                )
+            except Exception:
+                _reset_connection()
+                raise
+        except Exception:
+            _reset_connection()
+            raise
     return "sent"
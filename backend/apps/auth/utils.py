@@ -4,21 +4,31 @@ from django.core.signing import BadSignature, SignatureExpired, TimestampSigner
 from django.utils.translation import gettext as _
 
 EMAIL_CONFIRMATION_SALT = "apps.auth.email-confirmation"
+_SIGNER = TimestampSigner(salt=EMAIL_CONFIRMATION_SALT)
+ACTIVE_USER_CACHE_TTL_SECONDS = 60
 
 
 class EmailConfirmationTokenError(ValueError):
     """Ошибка обработки токена подтверждения email."""
 
 
+def normalize_email(value: str) -> str:
+    """Приводит email к каноническому виду для хранения и поиска."""
+    return value.strip().lower()
+
+
+def build_active_user_cache_key(normalized_email: str) -> str:
+    """Ключ кеша с отметкой, что пользователь с этим email уже активирован."""
+    return f"user_active:{normalized_email}"
+
+
 def make_email_confirmation_token(user_id: int) -> str:
-    signer = TimestampSigner(salt=EMAIL_CONFIRMATION_SALT)
-    return signer.sign(str(user_id))
+    return _SIGNER.sign(str(user_id))
 
 
 def verify_email_confirmation_token(token: str, max_age_seconds: int = 172_800) -> int:
-    signer = TimestampSigner(salt=EMAIL_CONFIRMATION_SALT)
     try:
-        raw_user_id = signer.unsign(token, max_age=max_age_seconds)
+        raw_user_id = _SIGNER.unsign(token, max_age=max_age_seconds)
     except SignatureExpired as exc:
         raise EmailConfirmationTokenError(
             _("Срок действия токена подтверждения истёк.")
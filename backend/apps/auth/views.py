@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import sys
 
 from django.conf import settings
@@ -14,7 +15,6 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .emails import send_confirmation_email
 from .serializers import (
     EmailTokenObtainPairSerializer,
     RegistrationSerializer,
@@ -24,6 +24,10 @@ from .tasks import send_confirmation_email_async
 from .utils import EmailConfirmationTokenError, verify_email_confirmation_token
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
+# Схема привязывается к view при каждом обращении, поэтому один экземпляр
+# можно разделить между всеми view модуля.
+_AUTH_SCHEMA = AutoSchema()
 
 
 def _dispatch_confirmation_email(user: User) -> None:
@@ -37,19 +41,21 @@ def _dispatch_confirmation_email(user: User) -> None:
     try:
         send_confirmation_email_async.delay(user.pk)
     except Exception:
-        send_confirmation_email(user)
+        # Не отправляем письмо синхронно: SMTP не должен блокировать ответ.
+        logger.exception("Failed to enqueue confirmation email for user %s", user.pk)
 
 
 class RegistrationView(APIView):
     """Создаёт нового пользователя и отправляет письмо для подтверждения email."""
 
     permission_classes = [AllowAny]
-    schema = AutoSchema()
+    schema = _AUTH_SCHEMA
 
     def post(self, request: Request) -> Response:
         serializer = RegistrationSerializer(data=request.data)
         try:
             serializer.is_valid(raise_exception=True)
+            user = serializer.save()
         except ValidationError as exc:
             errors = exc.detail
             message = _("Некорректные данные.")
@@ -63,7 +69,6 @@ class RegistrationView(APIView):
                 {"detail": message, "errors": errors},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        user = serializer.save()
         _dispatch_confirmation_email(user)
         return Response(
             {"message": "confirmation_sent"}, status=status.HTTP_201_CREATED
@@ -74,7 +79,7 @@ class ResendConfirmationView(APIView):
     """Повторно отправляет письмо подтверждения на указанный email."""
 
     permission_classes = [AllowAny]
-    schema = AutoSchema()
+    schema = _AUTH_SCHEMA
 
     def post(self, request: Request) -> Response:
         serializer = ResendConfirmationSerializer(data=request.data)
@@ -89,42 +94,21 @@ class LoginView(TokenObtainPairView):
 
     permission_classes = [AllowAny]
     serializer_class = EmailTokenObtainPairSerializer
-    schema = AutoSchema()
-
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        """Возвращает понятное сообщение, если пользователь ещё не подтвердил email."""
-        email = request.data.get("email")
-        if isinstance(email, str):
-            normalized = email.strip()
-            if normalized:
-                try:
-                    user = User.objects.get(email__iexact=normalized)
-                except User.DoesNotExist:
-                    pass
-                else:
-                    if not user.is_active:
-                        message = _(
-                            "Учётная запись ещё не активирована. Проверьте почту."
-                        )
-                        return Response(
-                            {"detail": message},
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-        return super().post(request, *args, **kwargs)
+    schema = _AUTH_SCHEMA
 
 
 class RefreshView(TokenRefreshView):
     """Выдаёт новый access-токен по refresh."""
 
     permission_classes = [AllowAny]
-    schema = AutoSchema()
+    schema = _AUTH_SCHEMA
 
 
 class EmailConfirmView(APIView):
     """Подтверждает email по токену из письма."""
 
     permission_classes = [AllowAny]
-    schema = AutoSchema()
+    schema = _AUTH_SCHEMA
 
     def get(self, request: Request) -> Response:
         token = request.query_params.get("token")
@@ -142,15 +126,11 @@ class EmailConfirmView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user = User.objects.filter(pk=user_id).first()
-        if user is None:
+        updated = User.objects.filter(pk=user_id, is_active=False).update(is_active=True)
+        if updated == 0 and not User.objects.filter(pk=user_id).exists():
             return Response(
                 {"token": [_("Пользователь не найден.")]},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if not user.is_active:
-            user.is_active = True
-            user.save(update_fields=["is_active"])
-
         return Response({"message": "email_confirmed"}, status=status.HTTP_200_OK)
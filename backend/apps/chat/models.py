@@ -30,7 +30,7 @@ class Message(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["event", "created_at"]),
+            models.Index(fields=["event", "created_at", "id"], name="msg_event_ts_id"),
         ]
         ordering = ["created_at", "id"]
         verbose_name = "Сообщение"
@@ -1,10 +1,29 @@
 from __future__ import annotations
 
+from typing import Any, Iterable
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.storage import default_storage
 from rest_framework import serializers
+from rest_framework.request import Request
 
 from apps.chat.models import Message
+from apps.common.serializers import absolute_url, build_absolute_prefix
+
+# Колонки ``values()`` для списка сообщений; авторы догружаются отдельным батчем.
+MESSAGE_ROW_FIELDS = (
+    "id",
+    "event_id",
+    "author_id",
+    "text",
+    "created_at",
+    "edited_at",
+)
+
+# Колонки ``values()`` для авторов страницы сообщений.
+AUTHOR_ROW_FIELDS = ("id", "name", "email", "avatar", "avatar_url")
+
+_DATETIME_FIELD = serializers.DateTimeField()
 
 
 class MessageSerializer(serializers.ModelSerializer):
@@ -59,10 +78,9 @@ class MessageSerializer(serializers.ModelSerializer):
         except (ValueError, ObjectDoesNotExist):  # noqa: PERF203
             return None
 
-        request = self.context.get("request")
-        if request is not None:
-            return request.build_absolute_uri(relative_url)
-        return relative_url
+        if "abs_prefix" not in self.context:
+            self.context["abs_prefix"] = build_absolute_prefix(self.context.get("request"))
+        return absolute_url(relative_url, self.context["abs_prefix"])
 
     def get_is_me(self, obj: Message) -> bool:
         request = self.context.get("request")
@@ -71,6 +89,79 @@ class MessageSerializer(serializers.ModelSerializer):
         return request.user.id == obj.author_id
 
 
+def _row_avatar(author: dict[str, Any], abs_prefix: str | None) -> str | None:
+    avatar_url = author.get("avatar_url")
+    if avatar_url:
+        return avatar_url
+    avatar_name = author.get("avatar")
+    if not avatar_name:
+        return None
+    return absolute_url(default_storage.url(avatar_name), abs_prefix)
+
+
+def _row_author_name(author: dict[str, Any]) -> str:
+    return str(author.get("name") or author.get("email") or "")
+
+
+def serialize_message_rows(
+    rows: Iterable[dict[str, Any]],
+    authors: dict[int, dict[str, Any]],
+    request: Request | None,
+) -> list[dict[str, Any]]:
+    """Собирает ответ списка сообщений из строк ``values()`` без MessageSerializer.
+
+    ``authors`` — строки пользователей по id, загруженные один раз на страницу.
+    Формат совпадает с ``MessageSerializer``.
+    """
+    current_user_id = getattr(getattr(request, "user", None), "id", None)
+    abs_prefix = build_absolute_prefix(request)
+    to_representation = _DATETIME_FIELD.to_representation
+    author_fields = {
+        author_id: (_row_author_name(author), _row_avatar(author, abs_prefix))
+        for author_id, author in authors.items()
+    }
+    missing_author = ("", None)
+    return [
+        {
+            "id": row["id"],
+            "event": row["event_id"],
+            "author": row["author_id"],
+            "author_name": author_fields.get(row["author_id"], missing_author)[0],
+            "author_avatar": author_fields.get(row["author_id"], missing_author)[1],
+            "is_me": current_user_id is not None and row["author_id"] == current_user_id,
+            "text": row["text"],
+            "created_at": to_representation(row["created_at"]),
+            "edited_at": to_representation(row["edited_at"]),
+        }
+        for row in rows
+    ]
+
+
+def serialize_created_message(message: Message, request: Request) -> dict[str, Any]:
+    """Ответ на создание сообщения из уже загруженных объектов, без MessageSerializer.
+
+    Автор — ``request.user``, поэтому дополнительных запросов не требуется.
+    """
+    user = request.user
+    avatar = getattr(user, "avatar", None)
+    author = {
+        "id": user.id,
+        "name": getattr(user, "name", None),
+        "email": getattr(user, "email", ""),
+        "avatar": avatar.name if avatar else None,
+        "avatar_url": getattr(user, "avatar_url", None),
+    }
+    row = {
+        "id": message.id,
+        "event_id": message.event_id,
+        "author_id": message.author_id,
+        "text": message.text,
+        "created_at": message.created_at,
+        "edited_at": message.edited_at,
+    }
+    return serialize_message_rows([row], {user.id: author}, request)[0]
+
+
 class MessageCreateSerializer(serializers.Serializer):
     """Валидация входящих данных для создания сообщения."""
 
@@ -79,7 +170,7 @@ class MessageCreateSerializer(serializers.Serializer):
     )
 
     def validate_text(self, value: str) -> str:
-        trimmed = value.strip()
-        if not trimmed:
+        # trim_whitespace=True уже обрезал пробелы, повторный strip() не нужен.
+        if not value:
             raise serializers.ValidationError("Текст сообщения не может быть пустым.")
-        return trimmed
+        return value
@@ -156,6 +156,62 @@ def test_pagination_and_before_after_id_filters() -> None:
     assert both_texts == [f"Сообщение {i}" for i in range(6, 11)]
 
 
+def test_before_after_id_use_keyset_links_without_count() -> None:
+    event, owner = _create_event()
+    messages = [
+        Message.objects.create(event=event, author=owner, text=f"Сообщение {index}")
+        for index in range(1, 8)
+    ]
+
+    client = _auth_client(owner)
+    response = client.get(
+        f"/api/events/{event.id}/messages",
+        {"before_id": messages[-1].id, "page_size": 3},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert "count" not in payload
+    assert [item["id"] for item in payload["results"]] == [
+        message.id for message in messages[3:6]
+    ]
+    assert f"before_id={messages[3].id}" in payload["previous"]
+    assert f"after_id={messages[5].id}" in payload["next"]
+
+    newest = client.get(
+        f"/api/events/{event.id}/messages",
+        {"after_id": messages[3].id, "page_size": 3},
+    ).json()
+    assert [item["id"] for item in newest["results"]] == [
+        message.id for message in messages[4:7]
+    ]
+    assert newest["next"] is None
+    assert f"before_id={messages[4].id}" in newest["previous"]
+
+    oldest = client.get(
+        f"/api/events/{event.id}/messages",
+        {"before_id": messages[3].id, "page_size": 3},
+    ).json()
+    assert oldest["previous"] is None
+    assert f"after_id={messages[2].id}" in oldest["next"]
+
+
+def test_keyset_cursor_follows_created_at_order() -> None:
+    event, owner = _create_event()
+    older = Message.objects.create(event=event, author=owner, text="Старое")
+    middle = Message.objects.create(event=event, author=owner, text="Среднее")
+    newer = Message.objects.create(event=event, author=owner, text="Новое")
+    Message.objects.filter(id=middle.id).update(
+        created_at=older.created_at - timedelta(seconds=10)
+    )
+    Message.objects.filter(id=newer.id).update(
+        created_at=older.created_at + timedelta(seconds=5)
+    )
+
+    client = _auth_client(owner)
+    response = client.get(f"/api/events/{event.id}/messages", {"after_id": middle.id})
+    assert [item["text"] for item in response.json()["results"]] == ["Старое", "Новое"]
+
+
 def test_rate_limit_simple_antispam_429() -> None:
     event, _ = _create_event()
     participant = User.objects.create_user(
@@ -1,34 +1,144 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import math
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
-from django.db.models import QuerySet
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q, QuerySet
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
+from drf_spectacular.openapi import AutoSchema
 from rest_framework import generics, status
-from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ParseError
 from rest_framework.pagination import PageNumberPagination
-from drf_spectacular.openapi import AutoSchema
-from rest_framework.views import APIView
-from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
 
 from apps.chat.models import Message
-from apps.events.permissions import IsEventMember, IsEventOrganizer
-from apps.chat.serializers import MessageCreateSerializer, MessageSerializer
+from apps.chat.serializers import (
+    AUTHOR_ROW_FIELDS,
+    MESSAGE_ROW_FIELDS,
+    MessageCreateSerializer,
+    MessageSerializer,
+    serialize_created_message,
+    serialize_message_rows,
+)
 from apps.chat.ws_notify import ws_chat_send
+from apps.common.renderers import ORJSONRenderer
 from apps.events.models import Event
+from apps.events.permissions import IsEventMember, IsEventOrganizer
+from apps.tasks.cache_utils import cache_safe_add, cache_safe_get, cache_safe_set
 
 MESSAGE_RATE_LIMIT = timedelta(seconds=0.8)
+_RATE_LIMIT_SECONDS = MESSAGE_RATE_LIMIT.total_seconds()
+# Redis хранит TTL в целых секундах, поэтому окно проверяется по сохранённой метке.
+_RATE_LIMIT_CACHE_TIMEOUT = math.ceil(_RATE_LIMIT_SECONDS)
+
+
+User = get_user_model()
+
+
+def _load_authors(rows: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+    """Загружает авторов страницы одним запросом: K уникальных строк вместо N в JOIN."""
+    author_ids = {row["author_id"] for row in rows}
+    if not author_ids:
+        return {}
+    return {
+        author["id"]: author
+        for author in User.objects.filter(id__in=author_ids).values(*AUTHOR_ROW_FIELDS)
+    }
+
+
+def _build_rate_limit_key(event_id: int, user_id: int) -> str:
+    return f"chat:rl:{event_id}:{user_id}"
+
+
+def _is_rate_limited(event_id: int, user_id: int) -> bool:
+    """Проверяет антиспам-окно по метке последней отправки в кеше, без запроса к БД."""
+    key = _build_rate_limit_key(event_id, user_id)
+    now = time.time()
+    if cache_safe_add(key, now, timeout=_RATE_LIMIT_CACHE_TIMEOUT):
+        return False
+    last_sent = cache_safe_get(key)
+    if isinstance(last_sent, float) and now - last_sent < _RATE_LIMIT_SECONDS:
+        return True
+    cache_safe_set(key, now, timeout=_RATE_LIMIT_CACHE_TIMEOUT)
+    return False
 
 
 class MessagePagination(PageNumberPagination):
-    """Настройки пагинации сообщений."""
+    """Настройки пагинации сообщений.
+
+    Запросы с ``before_id``/``after_id`` обслуживаются как keyset-курсор по
+    ``(created_at, id)``: без ``COUNT(*)`` и ``OFFSET``, ``LIMIT page_size + 1`` по индексу
+    ``(event, created_at, id)``. Лишняя строка показывает, есть ли продолжение в
+    направлении курсора; наличие строк в обратную сторону view сообщает через
+    ``has_newer``/``has_older``. Ссылки ``next`` (новее) и ``previous`` (старше)
+    выдаются только когда за ними есть сообщения.
+    """
 
     page_size = 30
     page_size_query_param = "page_size"
     max_page_size = 100
+    keyset_query_params = ("before_id", "after_id")
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Message], request: Request, view: Any = None
+    ) -> list[Message] | None:
+        self.keyset = any(request.query_params.get(name) for name in self.keyset_query_params)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        rows = list(queryset[: page_size + 1])
+        self.has_more = len(rows) > page_size
+        self.has_newer = self.has_older = False
+        return rows[:page_size]
+
+    def get_paginated_response(self, data: Any) -> Response:
+        if not getattr(self, "keyset", False):
+            return super().get_paginated_response(data)
+
+        url = self.request.build_absolute_uri()
+        for name in self.keyset_query_params:
+            url = remove_query_param(url, name)
+        next_url = previous_url = None
+        if data and self.has_newer:
+            next_url = replace_query_param(url, "after_id", data[-1]["id"])
+        if data and self.has_older:
+            previous_url = replace_query_param(url, "before_id", data[0]["id"])
+        return Response({"next": next_url, "previous": previous_url, "results": data})
+
+
+def _rows_beyond(
+    queryset: QuerySet[Message], created_at: datetime | None, message_id: int, *, older: bool
+) -> QuerySet[Message]:
+    """Сообщения строго старше/новее строки ``(created_at, id)`` в порядке ленты.
+
+    Нестрогая граница по ``created_at`` задаёт диапазон по индексу, OR уточняет
+    сравнение внутри одной метки времени. Без метки (якорь удалён или чужой)
+    остаётся сравнение по ``id``.
+    """
+    if created_at is None:
+        return queryset.filter(id__lt=message_id) if older else queryset.filter(id__gt=message_id)
+    if older:
+        return queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=message_id),
+            created_at__lte=created_at,
+        )
+    return queryset.filter(
+        Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=message_id),
+        created_at__gte=created_at,
+    )
 
 
 class EventMessageListCreateView(generics.GenericAPIView):
@@ -36,6 +146,7 @@ class EventMessageListCreateView(generics.GenericAPIView):
     """Просмотр и создание сообщений по событию."""
 
     permission_classes = [IsAuthenticated, IsEventMember]
+    renderer_classes = [ORJSONRenderer]
     serializer_class = MessageSerializer
     pagination_class = MessagePagination
 
@@ -47,35 +158,53 @@ class EventMessageListCreateView(generics.GenericAPIView):
         return MessageSerializer
 
     def get_event(self) -> Event:
-        event = get_object_or_404(Event, pk=self.kwargs["event_id"])
-        self.check_object_permissions(self.request, event)
+        """Событие запроса: загружается и проверяется один раз на экземпляр view."""
+        event = getattr(self, "_event", None)
+        if event is None:
+            event = get_object_or_404(
+                Event.objects.only("id", "owner_id", "participant_ids"),
+                pk=self.kwargs["event_id"],
+            )
+            self.check_object_permissions(self.request, event)
+            self._event = event
         return event
 
     def _parse_int_param(self, request: Request, name: str) -> int | None:
         raw = request.query_params.get(name)
         if raw in (None, ""):
             return None
-        try:
-            value = int(raw)
-        except (TypeError, ValueError) as exc:
-            raise ParseError(f"Параметр {name} должен быть целым числом.") from exc
-        if value < 0:
+        raw = raw.strip()
+        # isdecimal() совпадает с множеством цифр, которые принимает int(), без try/except.
+        if raw.isdecimal():
+            return int(raw)
+        if raw.startswith("-") and raw[1:].isdecimal():
             raise ParseError(f"Параметр {name} должен быть положительным.")
-        return value
+        raise ParseError(f"Параметр {name} должен быть целым числом.")
+
+    def _anchor_created_at(self, message_id: int) -> datetime | None:
+        return (
+            Message.objects.filter(event_id=self.get_event().id, pk=message_id)
+            .values_list("created_at", flat=True)
+            .first()
+        )
 
     def get_queryset(self) -> QuerySet[Message]:
         event = self.get_event()
-        queryset = Message.objects.filter(event=event).select_related("author")
+        queryset = Message.objects.filter(event=event)
 
         before_id = self._parse_int_param(self.request, "before_id")
         after_id = self._parse_int_param(self.request, "after_id")
         self._ordered_desc = False
         if before_id is not None:
-            queryset = queryset.filter(id__lt=before_id)
+            queryset = _rows_beyond(
+                queryset, self._anchor_created_at(before_id), before_id, older=True
+            )
             queryset = queryset.order_by("-created_at", "-id")
             self._ordered_desc = True
         elif after_id is not None:
-            queryset = queryset.filter(id__gt=after_id)
+            queryset = _rows_beyond(
+                queryset, self._anchor_created_at(after_id), after_id, older=False
+            )
 
         if not self._ordered_desc:
             queryset = queryset.order_by("created_at", "id")
@@ -83,48 +212,52 @@ class EventMessageListCreateView(generics.GenericAPIView):
         return queryset
 
     def get(self, request: Request, *args, **kwargs) -> Response:
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            items = list(page)
-            if getattr(self, "_ordered_desc", False):
-                items = list(reversed(items))
-            serializer = MessageSerializer(
-                items, many=True, context={"request": request}
-            )
-            return self.get_paginated_response(serializer.data)
-
-        items = list(queryset)
+        rows = self.get_queryset().values(*MESSAGE_ROW_FIELDS)
+        page = self.paginate_queryset(rows)
+        items = list(page if page is not None else rows)
         if getattr(self, "_ordered_desc", False):
             items.reverse()
-        serializer = MessageSerializer(items, many=True, context={"request": request})
-        return Response(serializer.data)
+        if page is not None and self.paginator.keyset and items:
+            self._set_keyset_neighbours(items)
+        data = serialize_message_rows(items, _load_authors(items), request)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def _set_keyset_neighbours(self, items: list[dict[str, Any]]) -> None:
+        """Продолжение по курсору известно из лишней строки, обратная сторона — из EXISTS."""
+        paginator = self.paginator
+        messages = Message.objects.filter(event_id=self.get_event().id)
+        if self._ordered_desc:
+            last = items[-1]
+            paginator.has_older = paginator.has_more
+            paginator.has_newer = _rows_beyond(
+                messages, last["created_at"], last["id"], older=False
+            ).exists()
+        else:
+            first = items[0]
+            paginator.has_newer = paginator.has_more
+            paginator.has_older = _rows_beyond(
+                messages, first["created_at"], first["id"], older=True
+            ).exists()
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         event = self.get_event()
         serializer = MessageCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        text = serializer.validated_data["text"].strip()
+        text = serializer.validated_data["text"]
 
         user = request.user
         assert user is not None  # для mypy
 
-        last_message = (
-            Message.objects.filter(event=event, author=user)
-            .order_by("-created_at", "-id")
-            .first()
-        )
-        if last_message is not None:
-            elapsed = timezone.now() - last_message.created_at
-            if elapsed < MESSAGE_RATE_LIMIT:
-                return Response(
-                    {"detail": "Слишком часто отправляете сообщения. Повторите позже."},
-                    status=status.HTTP_429_TOO_MANY_REQUESTS,
-                )
+        if _is_rate_limited(event.id, user.id):
+            return Response(
+                {"detail": "Слишком часто отправляете сообщения. Повторите позже."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
 
         message = Message.objects.create(event=event, author=user, text=text)
-        response_serializer = MessageSerializer(message, context={"request": request})
-        response_data = response_serializer.data
+        response_data = serialize_created_message(message, request)
 
         chat_payload = {
             "id": response_data["id"],
@@ -135,7 +268,9 @@ class EventMessageListCreateView(generics.GenericAPIView):
             "text": response_data["text"],
             "created_at": response_data["created_at"],
         }
-        ws_chat_send(event.id, "chat.message", chat_payload)
+        transaction.on_commit(
+            partial(ws_chat_send, event.id, "chat.message", chat_payload)
+        )
 
         return Response(response_data, status=status.HTTP_201_CREATED)
 
@@ -145,7 +280,10 @@ class EventMessageDetailView(APIView):
     permission_classes = [IsAuthenticated, IsEventMember]
 
     def get_event(self, request: Request, event_id: int) -> Event:
-        event = get_object_or_404(Event, pk=event_id)
+        event = get_object_or_404(
+            Event.objects.only("id", "owner_id", "participant_ids", "organizer_ids"),
+            pk=event_id,
+        )
         self.check_object_permissions(request, event)
         return event
 
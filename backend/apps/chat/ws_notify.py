@@ -1,18 +1,76 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
 from typing import Any
 
 from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+
+from apps.utils.ws import build_broadcast_message
+
+logger = logging.getLogger(__name__)
+
+# asyncio держит задачи слабыми ссылками: без этого набора отправку может собрать GC.
+_pending_sends: set[asyncio.Future[None] | Future[None]] = set()
+
+# Отдельный цикл событий для отправок из синхронного кода (WSGI, Celery, потоки ASGI).
+_send_loop: asyncio.AbstractEventLoop | None = None
+_send_loop_lock = threading.Lock()
+
+
+def _finish_send(future: asyncio.Future[None] | Future[None]) -> None:
+    _pending_sends.discard(future)
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("ws_chat_send: group_send failed", exc_info=exc)
+
+
+def _get_send_loop() -> asyncio.AbstractEventLoop:
+    """Запускает при первом вызове постоянный цикл событий в фоновом потоке процесса."""
+    global _send_loop
+    with _send_loop_lock:
+        if _send_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="ws-chat-send", daemon=True
+            ).start()
+            _send_loop = loop
+    return _send_loop
 
 
 def ws_chat_send(event_id: int, message_type: str, payload: dict[str, Any]) -> None:
-    """Отправка компактного события чата всем участникам события."""
+    """Отправка компактного события чата всем участникам события, не блокируя вызывающий поток.
+
+    В работающем цикле отправка ставится задачей в него же; из синхронного кода она
+    уходит в фоновый цикл ``_get_send_loop``. ``InMemoryChannelLayer`` привязан к циклу
+    своих получателей, поэтому для него остаётся ``async_to_sync``. Кадр кодируется
+    один раз здесь, см. ``build_broadcast_message``.
+    """
 
     channel_layer = get_channel_layer()
     if channel_layer is None:
         return
-    async_to_sync(channel_layer.group_send)(
-        f"event:{event_id}",
-        {"type": "broadcast", "message_type": message_type, "payload": payload},
-    )
+    group = f"event:{event_id}"
+    message = build_broadcast_message(message_type, payload)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        future: asyncio.Future[None] | Future[None] = loop.create_task(
+            channel_layer.group_send(group, message)
+        )
+    elif isinstance(channel_layer, InMemoryChannelLayer):
+        async_to_sync(channel_layer.group_send)(group, message)
+        return
+    else:
+        future = asyncio.run_coroutine_threadsafe(
+            channel_layer.group_send(group, message), _get_send_loop()
+        )
+    _pending_sends.add(future)
+    future.add_done_callback(_finish_send)
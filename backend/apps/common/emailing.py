@@ -4,6 +4,7 @@ from typing import Any, Iterable
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 
@@ -20,8 +21,13 @@ def send_templated_email(
     subject: str,
     template: str,
     context: dict[str, Any] | None = None,
+    connection: BaseEmailBackend | None = None,
 ) -> None:
-    """Отправляет письмо с HTML-шаблоном и текстовой версией."""
+    """Отправляет письмо с HTML-шаблоном и текстовой версией.
+
+    Через ``connection`` можно передать уже открытое соединение, чтобы несколько
+    писем ушли без повторного SMTP-рукопожатия.
+    """
     recipients = [address for address in to if address]
     if not recipients:
         return
@@ -38,6 +44,7 @@ def send_templated_email(
         body=text_body,
         from_email=from_email,
         to=recipients,
+        connection=connection,
     )
     email.attach_alternative(html_body, "text/html")
     email.send()
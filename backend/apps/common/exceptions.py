@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
 from django.utils.translation import gettext as _
@@ -38,12 +40,14 @@ _DETAIL_TRANSLATIONS: dict[str, str] = {
 }
 
 
+_CYRILLIC_RE = re.compile("[\u0400-\u04ff]")
+
+
 def _contains_cyrillic(value: str) -> bool:
-    return any(
-        "\u0400" <= char <= "\u04ff" or char in {"\u0451", "\u0401"} for char in value
-    )
+    return _CYRILLIC_RE.search(value) is not None
 
 
+@lru_cache(maxsize=256)
 def _translate_detail(detail: str, status_code: int) -> str:
     if _contains_cyrillic(detail):
         return detail
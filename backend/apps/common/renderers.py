@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_FALLBACK_ENCODER = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON-рендерер на ``orjson`` для горячих списочных эндпоинтов.
+
+    Типы, которые ``orjson`` не знает (ленивые строки, ``Decimal`` и т.п.),
+    передаются стандартному ``JSONEncoder`` DRF, поэтому формат ответа не меняется.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_FALLBACK_ENCODER.default)
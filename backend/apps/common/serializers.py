@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.request import Request
+
+# Канонический origin из настроек, читается один раз при загрузке модуля.
+_ABSOLUTE_URI_BASE: str | None = (
+    getattr(settings, "ABSOLUTE_URI_BASE", "") or ""
+).rstrip("/") or None
+
+
+class CachedFieldsSerializer(serializers.ModelSerializer):
+    """ModelSerializer, который строит набор полей один раз на класс.
+
+    Результат ``get_fields()`` кешируется на классе как набор непривязанных
+    шаблонов; каждый экземпляр получает их глубокие копии (как ``get_fields``
+    в DRF), поэтому вложенные сериализаторы не делят состояние между запросами.
+    Подходит только для сериализаторов без динамически меняющихся полей.
+    """
+
+    def get_fields(self) -> dict[str, Any]:
+        cls = type(self)
+        cached = cls.__dict__.get("_field_cache")
+        if cached is None:
+            cached = super().get_fields()
+            cls._field_cache = cached
+        return {name: copy.deepcopy(field) for name, field in cached.items()}
+
+
+def build_absolute_prefix(request: Request | None) -> str | None:
+    """Схема и хост без завершающего слэша, вычисляемые один раз на ответ.
+
+    Если задан ``ABSOLUTE_URI_BASE``, запрос не используется.
+    """
+    if _ABSOLUTE_URI_BASE is not None:
+        return _ABSOLUTE_URI_BASE
+    if request is None:
+        return None
+    return request.build_absolute_uri("/")[:-1]
+
+
+def absolute_url(relative_url: str, abs_prefix: str | None) -> str:
+    if abs_prefix is not None and relative_url.startswith("/"):
+        return f"{abs_prefix}{relative_url}"
+    return relative_url
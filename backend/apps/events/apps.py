@@ -9,4 +9,8 @@ class EventsConfig(AppConfig):
     verbose_name = "События"
 
     def ready(self) -> None:
+        from apps.utils.ws import allow_colon_in_group_names
+
         from . import signals  # noqa: F401
+
+        allow_colon_in_group_names()
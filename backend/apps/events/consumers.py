@@ -1,23 +1,32 @@
 from __future__ import annotations
 
-import json
 import logging
 import time
-from typing import Any, cast
+from operator import attrgetter
+from typing import Any
 
+import orjson
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
-from apps.utils.ws import ensure_group_name_regex_allows_colon
-
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
-from apps.events.models import Participant
+from apps.events.membership import is_participant_cached
+from apps.utils.ws import build_broadcast_message
 from config.metrics import WS_ACTIVE_CONNECTIONS, WS_DISCONNECTS, WS_ERRORS
 
 logger = logging.getLogger(__name__)
 
 TYPING_RATE_LIMIT_SECONDS = 1.0
+TYPING_RATE_LIMIT_NS = int(TYPING_RATE_LIMIT_SECONDS * 1_000_000_000)
+
+# Display-name fields present on the user model, in priority order.
+_USER_NAME_GETTERS = tuple(
+    attrgetter(field)
+    for field in ("name", "email", "username")
+    if hasattr(get_user_model(), field)
+)
 
 
 class EventConsumer(AsyncJsonWebsocketConsumer):
@@ -31,6 +40,7 @@ class EventConsumer(AsyncJsonWebsocketConsumer):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._metrics_connected: bool = False
+        self._typing_last_ns: int = 0
 
     async def connect(self) -> None:
         user = self.scope.get("user")
@@ -59,7 +69,9 @@ class EventConsumer(AsyncJsonWebsocketConsumer):
         self.user_id = user.id
         self.group_name = f"event:{event_id}"
 
-        ensure_group_name_regex_allows_colon(self.channel_layer)
+        # Bound once per connection for the per-message broadcast and typing paths.
+        self._group_send = self.channel_layer.group_send
+        self._send_frame = self.send
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         logger.info("EventConsumer: user %s connected to event %s", user.id, event_id)
         WS_ACTIVE_CONNECTIONS.labels(consumer=self.metrics_consumer).inc()
@@ -101,31 +113,33 @@ class EventConsumer(AsyncJsonWebsocketConsumer):
                 self, "user_id", None
             ):
                 return
-        message = {"type": event["message_type"], "payload": event["payload"]}
-        if self._payload_exceeds_limit(message):
+        if "frame" not in event:
+            # Messages from producers that do not pre-encode a frame are encoded here.
+            event = build_broadcast_message(event["message_type"], event["payload"])
+        if event["frame_size"] > self.max_message_size:
             logger.warning(
                 "EventConsumer: message for event %s exceeds max size, dropping",
                 getattr(self, "event_id", "unknown"),
             )
             return
-        await self.send_json(message)
+        await self._send_frame(text_data=event["frame"])
 
-    @staticmethod
-    @database_sync_to_async
-    def _is_participant(event_id: int, user_id: int) -> bool:
-        return Participant.objects.filter(event_id=event_id, user_id=user_id).exists()
+    # Read-only and idempotent, so handshakes may check membership in parallel threads.
+    _is_participant = staticmethod(
+        database_sync_to_async(is_participant_cached, thread_sensitive=False)
+    )
 
     @property
     def max_message_size(self) -> int:
         return getattr(settings, "CHANNELS_WS_MAX_MESSAGE_SIZE", 64 * 1024)
 
-    def _payload_exceeds_limit(self, message: dict[str, Any]) -> bool:
-        serialized = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
-        return len(serialized.encode("utf-8")) > self.max_message_size
+    @classmethod
+    async def decode_json(cls, text_data: str) -> Any:
+        return orjson.loads(text_data)
 
     @classmethod
     async def encode_json(cls, content: Any) -> str:
-        return json.dumps(content, separators=(",", ":"), ensure_ascii=False)
+        return orjson.dumps(content).decode("utf-8")
 
     async def _handle_chat_typing(self, content: dict[str, Any]) -> None:
         if self.channel_layer is None:
@@ -147,45 +161,32 @@ class EventConsumer(AsyncJsonWebsocketConsumer):
             logger.debug("EventConsumer: unauthenticated typing attempt: %s", payload)
             return
 
-        if not self._typing_allowed(event_id):
+        if not self._typing_allowed():
             return
 
         user_name = self._resolve_user_name(user)
 
-        await self.channel_layer.group_send(
+        await self._group_send(
             self.group_name,
-            {
-                "type": "broadcast",
-                "message_type": "chat.typing",
-                "payload": {
-                    "event_id": event_id,
-                    "user_id": user.id,
-                    "user_name": user_name,
-                },
-                "sender_id": user.id,
-            },
+            build_broadcast_message(
+                "chat.typing",
+                {"event_id": event_id, "user_id": user.id, "user_name": user_name},
+                sender_id=user.id,
+            ),
         )
 
-    def _typing_allowed(self, event_id: int) -> bool:
-        last_sent_map = cast(
-            dict[int, float], self.scope.setdefault("_typing_last_sent", {})
-        )
-        now = time.monotonic()
-        last_value = last_sent_map.get(event_id, 0.0)
-        if now - last_value < TYPING_RATE_LIMIT_SECONDS:
+    def _typing_allowed(self) -> bool:
+        # A consumer serves exactly one event, so a single timestamp is enough.
+        now = time.monotonic_ns()
+        if now - self._typing_last_ns < TYPING_RATE_LIMIT_NS:
             return False
-        last_sent_map[event_id] = now
+        self._typing_last_ns = now
         return True
 
     @staticmethod
     def _resolve_user_name(user: Any) -> str:
-        name = getattr(user, "name", None)
-        if name:
-            return str(name)
-        email = getattr(user, "email", None)
-        if email:
-            return str(email)
-        username = getattr(user, "username", None)
-        if username:
-            return str(username)
+        for getter in _USER_NAME_GETTERS:
+            value = getter(user)
+            if value:
+                return str(value)
         return str(user)
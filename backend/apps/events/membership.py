@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from apps.events.models import Participant
+from apps.tasks.cache_utils import cache_safe_get, cache_safe_set
+
+# Настройки кеша членства в событии для WebSocket-подключений.
+PARTICIPANT_CACHE_KEY_TEMPLATE = "evpart:{event_id}:{user_id}"
+PARTICIPANT_CACHE_TTL_SECONDS = 300
+
+
+def build_participant_cache_key(event_id: int, user_id: int) -> str:
+    """Формирует ключ кеша членства пользователя в событии."""
+    return PARTICIPANT_CACHE_KEY_TEMPLATE.format(event_id=event_id, user_id=user_id)
+
+
+def is_participant_cached(event_id: int, user_id: int) -> bool:
+    """Проверяет членство, запоминая положительный ответ в кеше.
+
+    Отрицательный результат не кешируется, чтобы только что добавленный участник
+    сразу мог подключиться; удаление участника сбрасывает ключ сигналом.
+    """
+    cache_key = build_participant_cache_key(event_id, user_id)
+    if cache_safe_get(cache_key):
+        return True
+    exists = Participant.objects.filter(event_id=event_id, user_id=user_id).exists()
+    if exists:
+        cache_safe_set(cache_key, True, timeout=PARTICIPANT_CACHE_TTL_SECONDS)
+    return exists
@@ -0,0 +1,50 @@
+import django.contrib.postgres.fields
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+
+def backfill_membership_ids(apps, _schema_editor):
+    Event = apps.get_model("events", "Event")
+    Participant = apps.get_model("events", "Participant")
+    members = (
+        Participant.objects.filter(event_id=OuterRef("pk")).order_by("user_id").values("user_id")
+    )
+    Event.objects.update(
+        participant_ids=ArraySubquery(members),
+        organizer_ids=ArraySubquery(members.filter(role="organizer")),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0005_alter_event_title"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="participant_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+                verbose_name="ID участников",
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="organizer_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+                verbose_name="ID организаторов",
+            ),
+        ),
+        migrations.RunPython(backfill_membership_ids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0006_event_membership_ids"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="participant",
+            name="idx_participant_event",
+        ),
+        migrations.AddIndex(
+            model_name="participant",
+            index=models.Index(
+                fields=["event", "user"],
+                include=["role"],
+                name="idx_part_ev_usr_role",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+import apps.events.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_participant_event_role_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invite",
+            name="token_hash",
+            field=models.BinaryField(
+                editable=False, max_length=32, null=True, verbose_name="Хеш токена"
+            ),
+        ),
+        migrations.RunSQL(
+            "UPDATE events_invite SET token_hash = sha256(convert_to(token, 'UTF8'))",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name="invite",
+            name="token_hash",
+            field=models.BinaryField(
+                editable=False, max_length=32, unique=True, verbose_name="Хеш токена"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="invite",
+            name="token",
+            field=models.CharField(
+                default=apps.events.models._generate_invite_token,
+                help_text="Уникальный токен приглашения.",
+                max_length=128,
+                verbose_name="Токен",
+            ),
+        ),
+    ]
@@ -0,0 +1,169 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+# Массивы членства события поддерживаются в базе, а не сигналами Django: так их
+# не обходят queryset.update(), bulk_create/bulk_update, сырой SQL и админка.
+# Триггеры events_participant уровня оператора читают transition-таблицы и меняют
+# массивы через array-операции над текущей версией строки события, поэтому
+# параллельные вставки не теряют друг друга. Триггер events_event отбрасывает
+# записи массивов, пришедшие не из триггеров участников (pg_trigger_depth() < 2).
+MEMBERSHIP_SQL = """
+CREATE FUNCTION events_ids_union(a bigint[], b bigint[]) RETURNS bigint[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT coalesce(array_agg(DISTINCT x ORDER BY x), '{}') FROM unnest(a || b) AS x
+$$;
+
+CREATE FUNCTION events_ids_minus(a bigint[], b bigint[]) RETURNS bigint[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT coalesce(array_agg(x ORDER BY x), '{}') FROM unnest(a) AS x WHERE x <> ALL (b)
+$$;
+
+CREATE FUNCTION events_participant_inserted() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE events_event AS e
+    SET participant_ids = events_ids_union(e.participant_ids, added.user_ids),
+        organizer_ids = events_ids_union(e.organizer_ids, added.organizer_ids)
+    FROM (
+        SELECT event_id,
+               array_agg(user_id) AS user_ids,
+               coalesce(array_agg(user_id) FILTER (WHERE role = 'organizer'), '{}')
+                   AS organizer_ids
+        FROM new_rows
+        GROUP BY event_id
+    ) AS added
+    WHERE e.id = added.event_id;
+    RETURN NULL;
+END
+$$;
+
+CREATE FUNCTION events_participant_deleted() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE events_event AS e
+    SET participant_ids = events_ids_minus(e.participant_ids, removed.user_ids),
+        organizer_ids = events_ids_minus(e.organizer_ids, removed.user_ids)
+    FROM (
+        SELECT event_id, array_agg(user_id) AS user_ids
+        FROM old_rows
+        GROUP BY event_id
+    ) AS removed
+    WHERE e.id = removed.event_id;
+    RETURN NULL;
+END
+$$;
+
+CREATE FUNCTION events_participant_updated() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Строки без смены события, пользователя или роли массивы не трогают.
+    UPDATE events_event AS e
+    SET participant_ids = events_ids_minus(e.participant_ids, removed.user_ids),
+        organizer_ids = events_ids_minus(e.organizer_ids, removed.user_ids)
+    FROM (
+        SELECT o.event_id, array_agg(o.user_id) AS user_ids
+        FROM old_rows AS o
+        JOIN new_rows AS n ON n.id = o.id
+        WHERE (o.event_id, o.user_id, o.role) IS DISTINCT FROM (n.event_id, n.user_id, n.role)
+        GROUP BY o.event_id
+    ) AS removed
+    WHERE e.id = removed.event_id;
+
+    UPDATE events_event AS e
+    SET participant_ids = events_ids_union(e.participant_ids, added.user_ids),
+        organizer_ids = events_ids_union(e.organizer_ids, added.organizer_ids)
+    FROM (
+        SELECT n.event_id,
+               array_agg(n.user_id) AS user_ids,
+               coalesce(array_agg(n.user_id) FILTER (WHERE n.role = 'organizer'), '{}')
+                   AS organizer_ids
+        FROM old_rows AS o
+        JOIN new_rows AS n ON n.id = o.id
+        WHERE (o.event_id, o.user_id, o.role) IS DISTINCT FROM (n.event_id, n.user_id, n.role)
+        GROUP BY n.event_id
+    ) AS added
+    WHERE e.id = added.event_id;
+    RETURN NULL;
+END
+$$;
+
+CREATE FUNCTION events_event_membership_guard() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF pg_trigger_depth() < 2 THEN
+        IF TG_OP = 'INSERT' THEN
+            NEW.participant_ids := '{}';
+            NEW.organizer_ids := '{}';
+        ELSE
+            NEW.participant_ids := OLD.participant_ids;
+            NEW.organizer_ids := OLD.organizer_ids;
+        END IF;
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+UPDATE events_event AS e
+SET participant_ids = coalesce(
+        (SELECT array_agg(p.user_id ORDER BY p.user_id)
+         FROM events_participant AS p WHERE p.event_id = e.id),
+        '{}'),
+    organizer_ids = coalesce(
+        (SELECT array_agg(p.user_id ORDER BY p.user_id)
+         FROM events_participant AS p WHERE p.event_id = e.id AND p.role = 'organizer'),
+        '{}');
+
+CREATE TRIGGER events_participant_membership_insert
+AFTER INSERT ON events_participant
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION events_participant_inserted();
+
+CREATE TRIGGER events_participant_membership_delete
+AFTER DELETE ON events_participant
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION events_participant_deleted();
+
+CREATE TRIGGER events_participant_membership_update
+AFTER UPDATE ON events_participant
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION events_participant_updated();
+
+CREATE TRIGGER events_event_membership_guard
+BEFORE INSERT OR UPDATE ON events_event
+FOR EACH ROW EXECUTE FUNCTION events_event_membership_guard();
+"""
+
+REVERSE_MEMBERSHIP_SQL = """
+DROP TRIGGER IF EXISTS events_event_membership_guard ON events_event;
+DROP TRIGGER IF EXISTS events_participant_membership_update ON events_participant;
+DROP TRIGGER IF EXISTS events_participant_membership_delete ON events_participant;
+DROP TRIGGER IF EXISTS events_participant_membership_insert ON events_participant;
+DROP FUNCTION IF EXISTS events_event_membership_guard();
+DROP FUNCTION IF EXISTS events_participant_updated();
+DROP FUNCTION IF EXISTS events_participant_deleted();
+DROP FUNCTION IF EXISTS events_participant_inserted();
+DROP FUNCTION IF EXISTS events_ids_minus(bigint[], bigint[]);
+DROP FUNCTION IF EXISTS events_ids_union(bigint[], bigint[]);
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_invite_token_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["participant_ids"], name="idx_event_participant_ids"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["organizer_ids"], name="idx_event_organizer_ids"
+            ),
+        ),
+        migrations.RunSQL(MEMBERSHIP_SQL, reverse_sql=REVERSE_MEMBERSHIP_SQL),
+    ]
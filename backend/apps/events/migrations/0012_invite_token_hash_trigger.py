@@ -0,0 +1,46 @@
+import apps.events.models
+from django.db import migrations, models
+
+# token_hash вычисляется в базе при каждой вставке и обновлении строки: bulk_create,
+# queryset.update(token=...) и фикстуры не оставляют пустой или устаревший хеш.
+TOKEN_HASH_SQL = """
+UPDATE events_invite SET token_hash = sha256(convert_to(token, 'UTF8'));
+
+CREATE FUNCTION events_invite_token_hash() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.token_hash := sha256(convert_to(NEW.token, 'UTF8'));
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER events_invite_token_hash
+BEFORE INSERT OR UPDATE ON events_invite
+FOR EACH ROW EXECUTE FUNCTION events_invite_token_hash();
+"""
+
+REVERSE_TOKEN_HASH_SQL = """
+DROP TRIGGER IF EXISTS events_invite_token_hash ON events_invite;
+DROP FUNCTION IF EXISTS events_invite_token_hash();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0011_event_membership_triggers"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="invite",
+            name="token",
+            field=models.CharField(
+                default=apps.events.models._generate_invite_token,
+                help_text="Уникальный токен приглашения.",
+                max_length=128,
+                unique=True,
+                verbose_name="Токен",
+            ),
+        ),
+        migrations.RunSQL(TOKEN_HASH_SQL, reverse_sql=REVERSE_TOKEN_HASH_SQL),
+    ]
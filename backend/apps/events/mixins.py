@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.shortcuts import get_object_or_404
+
+from apps.events.models import Event
+
+# Поля события, которые читают проверки прав (IsEventOrganizer) и вложенные представления.
+EVENT_PERMISSION_FIELDS = ("id", "owner", "organizer_ids")
+
+
+class EventCacheMixin:
+    """Загружает событие из URL один раз на запрос и проверяет права на него.
+
+    Событие хранится в ``request._event_cache`` по id, поэтому повторные вызовы
+    ``get_event()`` в пределах запроса не обращаются к базе.
+    """
+
+    event_url_kwarg = "event_id"
+
+    def get_event(self) -> Event:
+        event_id = int(self.kwargs[self.event_url_kwarg])
+        cache = getattr(self.request, "_event_cache", None)
+        if cache is None:
+            cache = {}
+            self.request._event_cache = cache
+        event = cache.get(event_id)
+        if event is None:
+            event = get_object_or_404(Event.objects.only(*EVENT_PERMISSION_FIELDS), pk=event_id)
+            # Права на событие проверяются один раз, при первой загрузке.
+            self.check_object_permissions(self.request, event)
+            cache[event_id] = event
+        return event
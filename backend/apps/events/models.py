@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import secrets
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
 
@@ -26,6 +29,24 @@ class Event(models.Model):
     location = models.CharField("Локация", max_length=200, blank=True)
     created_at = models.DateTimeField("Создано", auto_now_add=True)
     updated_at = models.DateTimeField("Обновлено", auto_now=True)
+    # Денормализованное членство: пишут только триггеры events_participant (миграция 0011),
+    # записи этих полей из приложения триггер events_event отбрасывает.
+    participant_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="ID участников",
+    )
+    organizer_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="ID организаторов",
+    )
+
+    MEMBERSHIP_FIELDS = frozenset({"participant_ids", "organizer_ids"})
 
     class Meta:
         verbose_name = "Событие"
@@ -33,6 +54,9 @@ class Event(models.Model):
         indexes = [
             models.Index(fields=["owner", "start_at"], name="idx_event_owner_start"),
             models.Index(fields=["start_at"], name="idx_event_start"),
+            models.Index(fields=["owner", "category"], name="idx_event_owner_category"),
+            GinIndex(fields=["participant_ids"], name="idx_event_participant_ids"),
+            GinIndex(fields=["organizer_ids"], name="idx_event_organizer_ids"),
         ]
         ordering = ("-start_at", "id")
 
@@ -84,8 +108,13 @@ class Participant(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["event"], name="idx_participant_event"),
+            models.Index(
+                fields=["event", "user"],
+                include=["role"],
+                name="idx_part_ev_usr_role",
+            ),
             models.Index(fields=["user", "event"], name="idx_participant_user_event"),
+            models.Index(fields=["event", "role"], name="idx_part_event_role"),
         ]
 
     def __str__(self) -> str:
@@ -98,6 +127,11 @@ def _generate_invite_token() -> str:
     return secrets.token_urlsafe(32)
 
 
+def hash_invite_token(token: str) -> bytes:
+    """SHA-256 токена приглашения: по нему инвайт ищется в базе."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
 class Invite(models.Model):
     """Инвайт для присоединения к событию."""
 
@@ -115,6 +149,8 @@ class Invite(models.Model):
         default=_generate_invite_token,
         help_text="Уникальный токен приглашения.",
     )
+    # Поиск — по 32-байтному хешу; значение выставляет триггер базы (миграция 0012).
+    token_hash = models.BinaryField("Хеш токена", max_length=32, unique=True, editable=False)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.PROTECT,
@@ -143,6 +179,11 @@ class Invite(models.Model):
         """Короткое представление инвайта."""
         return f"Invite for event {self.event_id}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Держит хеш токена в памяти согласованным с тем, что запишет триггер базы."""
+        self.token_hash = hash_invite_token(self.token)
+        super().save(*args, **kwargs)
+
     def is_active(self, now: datetime | None = None) -> bool:
         """Инвайт активен, если не отозван, не просрочен и не исчерпан."""
         current_time = now or timezone.now()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
+from django.db.models import OuterRef, Subquery
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 from rest_framework.views import View
@@ -34,15 +36,25 @@ def _resolve_event_id_from_view(view: View, request: Request) -> int | None:
     if pk_value is None:
         return None
     try:
-        event_id = int(pk_value)
+        return int(pk_value)
     except (TypeError, ValueError):
         return None
-    if not Event.objects.filter(id=event_id).exists():
-        return None
-    return event_id
 
 
-def _resolve_event_id_from_object(obj: Any) -> int | None:
+def _is_event_pk_route(view: View) -> bool:
+    """True when the event id was taken from the ``pk`` URL kwarg (EventViewSet detail)."""
+    if callable(getattr(view, "get_event_id", None)):
+        return False
+    kwargs = getattr(view, "kwargs", {})
+    return "pk" in kwargs and "event_id" not in kwargs and "event_pk" not in kwargs
+
+
+_EVENT_RELATION_ATTRS = ("list", "poll", "option", "message", "task")
+_EVENT_ID_ACCESSORS: dict[type, Callable[[Any], int | None]] = {}
+
+
+def _probe_event_id(obj: Any) -> int | None:
+    """Generic attribute probing for objects that are not Django models."""
     if obj is None:
         return None
     if isinstance(obj, Event):
@@ -55,7 +67,7 @@ def _resolve_event_id_from_object(obj: Any) -> int | None:
         resolved = _resolve_event_id_from_object(event)
         if resolved is not None:
             return resolved
-    for attr in ("list", "poll", "option", "message", "task"):
+    for attr in _EVENT_RELATION_ATTRS:
         related = getattr(obj, attr, None)
         if related is None:
             continue
@@ -65,6 +77,52 @@ def _resolve_event_id_from_object(obj: Any) -> int | None:
     return None
 
 
+def _chain_accessor(
+    attr: str, nested: Callable[[Any], int | None]
+) -> Callable[[Any], int | None]:
+    def accessor(obj: Any) -> int | None:
+        related = getattr(obj, attr, None)
+        return None if related is None else nested(related)
+
+    return accessor
+
+
+def _compile_event_id_accessor(cls: type) -> Callable[[Any], int | None]:
+    """Finds the path from a model class to its event once, using model metadata."""
+    if issubclass(cls, Event):
+        return attrgetter("id")
+    meta = getattr(cls, "_meta", None)
+    if meta is None:
+        return _probe_event_id
+    relations = {
+        field.name: field.related_model
+        for field in meta.get_fields()
+        if field.many_to_one and field.related_model is not None
+    }
+    if relations.get("event") is Event:
+        return attrgetter("event_id")
+    for attr in _EVENT_RELATION_ATTRS:
+        related_model = relations.get(attr)
+        if related_model is not None:
+            return _chain_accessor(attr, _get_event_id_accessor(related_model))
+    return _probe_event_id
+
+
+def _get_event_id_accessor(cls: type) -> Callable[[Any], int | None]:
+    accessor = _EVENT_ID_ACCESSORS.get(cls)
+    if accessor is None:
+        accessor = _compile_event_id_accessor(cls)
+        _EVENT_ID_ACCESSORS[cls] = accessor
+    return accessor
+
+
+def _resolve_event_id_from_object(obj: Any) -> int | None:
+    if obj is None:
+        return None
+    event_id = _get_event_id_accessor(type(obj))(obj)
+    return event_id if isinstance(event_id, int) else None
+
+
 def _extract_request_keys(data_source: Any) -> set[str]:
     if data_source is None:
         return set()
@@ -82,41 +140,79 @@ def _is_task_instance(obj: Any) -> bool:
     return getattr(obj, "__class__", None).__name__ == "Task"
 
 
-class _ParticipantRoleResolver:
-    def __init__(self) -> None:
-        self._role_cache: dict[tuple[int, int], str | None] = {}
-        self._owner_cache: dict[tuple[int, int], bool] = {}
+def _get_request_cache(request: Request, name: str) -> dict[Any, Any]:
+    """Returns a dict stored on the request, shared by all permission classes of that request."""
+    cache = getattr(request, name, None)
+    if cache is None:
+        cache = {}
+        setattr(request, name, cache)
+    return cache
 
-    def _get_role(self, event_id: int, user_id: int) -> str | None:
-        cache_key = (event_id, user_id)
-        if cache_key not in self._role_cache:
-            role = (
-                Participant.objects.filter(event_id=event_id, user_id=user_id)
-                .values_list("role", flat=True)
-                .first()
-            )
-            self._role_cache[cache_key] = role
-        return self._role_cache[cache_key]
-
-    def _is_participant(self, event_id: int, user_id: int) -> bool:
-        if self._is_event_owner(event_id, user_id):
-            return True
-        return self._get_role(event_id, user_id) is not None
 
-    def _is_organizer(self, event_id: int, user_id: int) -> bool:
-        if self._is_event_owner(event_id, user_id):
-            return True
-        return self._get_role(event_id, user_id) == Participant.Role.ORGANIZER
+# Marks an event id without a row, so pk routes can answer 404 instead of 403.
+_EVENT_MISSING = "missing"
+_PARTICIPANT_ROLES = frozenset(Participant.Role.values)
+
 
-    def _is_event_owner(self, event_id: int, user_id: int) -> bool:
+class _ParticipantRoleResolver:
+    @staticmethod
+    def _load_role(event_id: int, user_id: int) -> str | None:
+        """Fetches the event owner and the user's role with one primary-key lookup."""
+        role_query = Participant.objects.filter(
+            event_id=OuterRef("pk"), user_id=user_id
+        ).values("role")[:1]
+        row = (
+            Event.objects.filter(id=event_id)
+            .order_by()
+            .annotate(member_role=Subquery(role_query))
+            .values_list("owner_id", "member_role")
+            .first()
+        )
+        if row is None:
+            return _EVENT_MISSING
+        owner_id, role = row
+        # The owner counts as an organizer even without a participant row.
+        return Participant.Role.ORGANIZER if owner_id == user_id else role
+
+    def _get_role(self, request: Request, event_id: int, user_id: int) -> str | None:
+        """Returns the user's effective role, cached on the request per (event_id, user_id).
+
+        DRF instantiates permission classes separately for has_permission and
+        has_object_permission, so the cache lives on the request itself.
+        """
         if not isinstance(event_id, int) or not isinstance(user_id, int):
-            return False
+            return None
+        role_cache = _get_request_cache(request, "_event_role_cache")
         cache_key = (event_id, user_id)
-        if cache_key not in self._owner_cache:
-            self._owner_cache[cache_key] = Event.objects.filter(
-                id=event_id, owner_id=user_id
-            ).exists()
-        return self._owner_cache[cache_key]
+        if cache_key not in role_cache:
+            role_cache[cache_key] = self._load_role(event_id, user_id)
+        return role_cache[cache_key]
+
+    def _is_participant(self, request: Request, event_id: int, user_id: int) -> bool:
+        return self._get_role(request, event_id, user_id) in _PARTICIPANT_ROLES
+
+    def _is_organizer(self, request: Request, event_id: int, user_id: int) -> bool:
+        return self._get_role(request, event_id, user_id) == Participant.Role.ORGANIZER
+
+    def _defer_missing_event(
+        self, request: Request, view: View, event_id: int, user_id: int
+    ) -> bool:
+        """Lets the view answer 404 for a missing event on ``pk`` routes instead of 403.
+
+        Called only after a denied check, when the role cache is already filled.
+        """
+        if not _is_event_pk_route(view):
+            return False
+        return self._get_role(request, event_id, user_id) == _EVENT_MISSING
+
+    @staticmethod
+    def _event_has_member(event: Event, user_id: int) -> bool:
+        """Checks the denormalized membership of an already loaded event without queries."""
+        return event.owner_id == user_id or user_id in event.participant_ids
+
+    @staticmethod
+    def _event_has_organizer(event: Event, user_id: int) -> bool:
+        return event.owner_id == user_id or user_id in event.organizer_ids
 
 
 class ReadOnlyOrEventMember(_ParticipantRoleResolver, BasePermission):
@@ -134,7 +230,9 @@ class ReadOnlyOrEventMember(_ParticipantRoleResolver, BasePermission):
             event_id = _resolve_event_id_from_view(view, request)
             if event_id is None:
                 return True
-            return self._is_participant(event_id, user.id)
+            if self._is_participant(request, event_id, user.id):
+                return True
+            return self._defer_missing_event(request, view, event_id, user.id)
         return True
 
     def has_object_permission(self, request: Request, view: View, obj: Any) -> bool:
@@ -143,10 +241,12 @@ class ReadOnlyOrEventMember(_ParticipantRoleResolver, BasePermission):
         user = getattr(request, "user", None)
         if user is None or not getattr(user, "is_authenticated", False):
             return False
+        if isinstance(obj, Event):
+            return self._event_has_member(obj, user.id)
         event_id = _resolve_event_id_from_object(obj)
         if event_id is None:
             return False
-        return self._is_participant(event_id, user.id)
+        return self._is_participant(request, event_id, user.id)
 
 
 class IsEventMember(_ParticipantRoleResolver, BasePermission):
@@ -161,16 +261,20 @@ class IsEventMember(_ParticipantRoleResolver, BasePermission):
         event_id = _resolve_event_id_from_view(view, request)
         if event_id is None:
             return True
-        return self._is_participant(event_id, user.id)
+        if self._is_participant(request, event_id, user.id):
+            return True
+        return self._defer_missing_event(request, view, event_id, user.id)
 
     def has_object_permission(self, request: Request, view: View, obj: Any) -> bool:
         user = getattr(request, "user", None)
         if user is None or not getattr(user, "is_authenticated", False):
             return False
+        if isinstance(obj, Event):
+            return self._event_has_member(obj, user.id)
         event_id = _resolve_event_id_from_object(obj)
         if event_id is None:
             return False
-        return self._is_participant(event_id, user.id)
+        return self._is_participant(request, event_id, user.id)
 
 
 class IsEventOrganizer(_ParticipantRoleResolver, BasePermission):
@@ -185,16 +289,20 @@ class IsEventOrganizer(_ParticipantRoleResolver, BasePermission):
         event_id = _resolve_event_id_from_view(view, request)
         if event_id is None:
             return True
-        return self._is_organizer(event_id, user.id)
+        if self._is_organizer(request, event_id, user.id):
+            return True
+        return self._defer_missing_event(request, view, event_id, user.id)
 
     def has_object_permission(self, request: Request, view: View, obj: Any) -> bool:
         user = getattr(request, "user", None)
         if user is None or not getattr(user, "is_authenticated", False):
             return False
+        if isinstance(obj, Event):
+            return self._event_has_organizer(obj, user.id)
         event_id = _resolve_event_id_from_object(obj)
         if event_id is None:
             return False
-        return self._is_organizer(event_id, user.id)
+        return self._is_organizer(request, event_id, user.id)
 
 
 class IsTaskEditor(_ParticipantRoleResolver, BasePermission):
@@ -216,9 +324,9 @@ class IsTaskEditor(_ParticipantRoleResolver, BasePermission):
         event_id = _resolve_event_id_from_view(view, request)
         if event_id is None:
             return True
-        if not self._is_participant(event_id, user.id):
-            return False
-        if self._is_organizer(event_id, user.id):
+        if not self._is_participant(request, event_id, user.id):
+            return self._defer_missing_event(request, view, event_id, user.id)
+        if self._is_organizer(request, event_id, user.id):
             return True
         action = getattr(view, "action", None)
         if action == "status":
@@ -236,9 +344,9 @@ class IsTaskEditor(_ParticipantRoleResolver, BasePermission):
         event_id = _resolve_event_id_from_object(obj)
         if event_id is None:
             return False
-        if not self._is_participant(event_id, user.id):
+        if not self._is_participant(request, event_id, user.id):
             return False
-        if self._is_organizer(event_id, user.id):
+        if self._is_organizer(request, event_id, user.id):
             return True
         if not _is_task_instance(obj):
             return False
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils import timezone
 from rest_framework import serializers
 
+from apps.common.serializers import (
+    CachedFieldsSerializer,
+    absolute_url,
+    build_absolute_prefix,
+)
 from apps.events.models import Event, Invite, Participant
 
 User = get_user_model()
 
 
+@lru_cache(maxsize=1)
+def _invite_url_prefix() -> str:
+    """Очищенный базовый URL фронтенда со страницей присоединения, вычисляется один раз."""
+    base_url = getattr(settings, "SITE_FRONT_URL", "http://localhost:3000").rstrip("/")
+    return f"{base_url}/join?token="
+
+
+@receiver(setting_changed)
+def _reset_invite_url_prefix(*, setting: str, **_: Any) -> None:
+    if setting == "SITE_FRONT_URL":
+        _invite_url_prefix.cache_clear()
+
+
 class EventOwnerSerializer(serializers.ModelSerializer):
     """Сериализатор для вложенного владельца события."""
 
@@ -21,12 +42,25 @@ class EventOwnerSerializer(serializers.ModelSerializer):
         fields = ("id", "email")
         read_only_fields = ("id", "email")
 
+    def to_representation(self, instance: Any) -> Any:
+        # В списке у многих событий один владелец: словарь строится один раз на ответ.
+        cache = self.context.setdefault("_owner_cache", {})
+        data = cache.get(instance.pk)
+        if data is None:
+            data = cache[instance.pk] = super().to_representation(instance)
+        return data
+
+
+class EventSerializer(CachedFieldsSerializer):
+    """Сериализатор для чтения событий.
 
-class EventSerializer(serializers.ModelSerializer):
-    """Сериализатор для чтения событий."""
+    Ожидает события с аннотацией ``viewer_role`` — роль текущего пользователя
+    (организатор для владельца без записи участника).
+    """
 
     owner = EventOwnerSerializer(read_only=True)
-    viewer_role = serializers.SerializerMethodField()
+    # Вычисляется в SQL (EventViewSet.get_queryset), без Python-метода на строку.
+    viewer_role = serializers.CharField(read_only=True, allow_null=True)
 
     class Meta:
         model = Event
@@ -45,22 +79,6 @@ class EventSerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
 
-    def get_viewer_role(self, obj: Event) -> str | None:
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user is None or not getattr(user, "is_authenticated", False):
-            return None
-        participant_role = (
-            Participant.objects.filter(event=obj, user=user)
-            .values_list("role", flat=True)
-            .first()
-        )
-        if participant_role:
-            return participant_role
-        if obj.owner_id == getattr(user, "id", None):
-            return Participant.Role.ORGANIZER
-        return None
-
 
 class EventCreateUpdateSerializer(serializers.ModelSerializer):
     """Сериализатор для создания и обновления событий."""
@@ -81,6 +99,13 @@ class EventCreateUpdateSerializer(serializers.ModelSerializer):
 
         return attrs
 
+    def update(self, instance: Event, validated_data: dict[str, Any]) -> Event:
+        """Сохраняем только изменённые поля, не трогая денормализованное членство."""
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
 
 class InviteCreateSerializer(serializers.Serializer):
     """Сериализатор создания инвайта."""
@@ -96,14 +121,16 @@ class InviteCreateSerializer(serializers.Serializer):
         user = self.context["user"]
         expires_in_hours: int = validated_data["expires_in_hours"]
         max_uses: int = validated_data.get("max_uses", 0)
+        # Момент создания может передать вызывающий код через ``save(now=...)``.
+        now = validated_data.get("now") or timezone.now()
 
-        expires_at = timezone.now() + timedelta(hours=expires_in_hours)
-        invite = Invite.objects.create(
+        invite = Invite(
             event=event,
             created_by=user,
-            expires_at=expires_at,
+            expires_at=now + timedelta(hours=expires_in_hours),
             max_uses=max_uses,
         )
+        invite.save(force_insert=True)
         return invite
 
 
@@ -126,10 +153,7 @@ class InviteReadSerializer(serializers.ModelSerializer):
 
     def get_invite_url(self, obj: Invite) -> str:
         """Формирует ссылку для присоединения."""
-        base_url = getattr(settings, "SITE_FRONT_URL", "http://localhost:3000").rstrip(
-            "/"
-        )
-        return f"{base_url}/join?token={obj.token}"
+        return _invite_url_prefix() + obj.token
 
 
 class ParticipantUserSerializer(serializers.ModelSerializer):
@@ -140,7 +164,6 @@ class ParticipantUserSerializer(serializers.ModelSerializer):
         fields = ("id", "email", "name", "avatar")
 
     def get_avatar(self, obj: User) -> str | None:
-        request = self.context.get("request")
         if obj.avatar_url:
             return obj.avatar_url
         avatar_field = getattr(obj, "avatar", None)
@@ -149,9 +172,10 @@ class ParticipantUserSerializer(serializers.ModelSerializer):
                 url = avatar_field.url
             except Exception:  # noqa: BLE001
                 return None
-            if request is not None:
-                return request.build_absolute_uri(url)
-            return url
+            # Префикс схемы и хоста считается один раз на ответ, а не на каждого участника.
+            if "abs_prefix" not in self.context:
+                self.context["abs_prefix"] = build_absolute_prefix(self.context.get("request"))
+            return absolute_url(url, self.context["abs_prefix"])
         return None
 
 
@@ -3,17 +3,23 @@ from __future__ import annotations
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models import Count, Max, Q
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from apps.events.membership import build_participant_cache_key
 from apps.events.models import Participant
+from apps.tasks.cache_utils import cache_safe_delete
+
+# Роль организатора проверяется при каждой записи участника.
+_ROLE_ORGANIZER = Participant.Role.ORGANIZER
 
 
 def _has_other_organizers(participant: Participant) -> bool:
     return (
         Participant.objects.filter(
             event=participant.event,
-            role=Participant.Role.ORGANIZER,
+            role=_ROLE_ORGANIZER,
         )
         .exclude(pk=participant.pk)
         .exists()
@@ -32,7 +38,7 @@ def _build_error(detail: str) -> ValidationError:
 def prevent_last_organizer_delete(
     sender: type[Participant], instance: Participant, **_: Any
 ) -> None:
-    if instance.role != Participant.Role.ORGANIZER:
+    if instance.role != _ROLE_ORGANIZER:
         return
     if not _has_other_organizers(instance):
         raise _build_error("Cannot remove the last organizer from the event.")
@@ -46,13 +52,25 @@ def prevent_last_organizer_demotion(
 ) -> None:
     if not instance.pk:
         return
-    try:
-        previous = Participant.objects.get(pk=instance.pk)
-    except Participant.DoesNotExist:
-        return
-    if previous.role != Participant.Role.ORGANIZER:
+    if instance.role == _ROLE_ORGANIZER:
         return
-    if instance.role == Participant.Role.ORGANIZER:
+    # Прежняя роль и число других организаторов читаются одним запросом.
+    state = Participant.objects.filter(event_id=instance.event_id).aggregate(
+        previous_role=Max("role", filter=Q(pk=instance.pk)),
+        other_organizers=Count(
+            "pk",
+            filter=Q(role=_ROLE_ORGANIZER) & ~Q(pk=instance.pk),
+        ),
+    )
+    if state["previous_role"] != _ROLE_ORGANIZER:
         return
-    if not _has_other_organizers(previous):
+    if not state["other_organizers"]:
         raise _build_error("Cannot demote the last organizer of the event.")
+
+
+@receiver(post_save, sender=Participant, dispatch_uid="participant_post_save_cache")
+@receiver(post_delete, sender=Participant, dispatch_uid="participant_post_delete_cache")
+def invalidate_participant_cache(
+    sender: type[Participant], instance: Participant, **_: Any
+) -> None:
+    cache_safe_delete(build_participant_cache_key(instance.event_id, instance.user_id))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from django.db import IntegrityError
-from django.db.models import Q, QuerySet
+from django.db.models import Case, OuterRef, Q, QuerySet, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
@@ -15,6 +15,32 @@ from apps.events.models import Event, Participant
 from apps.events.permissions import IsEventOrganizer, ReadOnlyOrEventMember
 from apps.events.serializers import EventCreateUpdateSerializer, EventSerializer
 
+# Колонки, которые читает EventSerializer; остальные поля владельца не загружаются.
+EVENT_READ_FIELDS = (
+    "id",
+    "title",
+    "category",
+    "description",
+    "start_at",
+    "end_at",
+    "location",
+    "created_at",
+    "updated_at",
+    "owner",
+    "owner__id",
+    "owner__email",
+)
+
+# Допустимые значения параметра ``upcoming``; остальные игнорируются.
+_UPCOMING_VALUES = {"true": True, "false": False}
+
+
+def _visible_events(user) -> QuerySet[Event]:
+    """События, где пользователь владелец или участник, без соединений и аннотаций."""
+    # Полусоединение через IN вместо JOIN + DISTINCT: строки не дублируются.
+    member_event_ids = Participant.objects.filter(user=user).values("event_id")
+    return Event.objects.filter(Q(owner=user) | Q(pk__in=member_event_ids))
+
 
 class EventPagination(PageNumberPagination):
     """Пагинация по 10 событий на страницу."""
@@ -42,11 +68,23 @@ class EventViewSet(viewsets.ModelViewSet):
     def get_queryset(self) -> QuerySet[Event]:
         """Возвращаем события, где пользователь владелец или участник."""
         user = self.request.user
+        participant_role = Participant.objects.filter(
+            event=OuterRef("pk"), user=user
+        ).values("role")[:1]
+        # Владелец без записи участника считается организатором.
+        viewer_role = Coalesce(
+            Subquery(participant_role),
+            Case(When(owner=user, then=Value(Participant.Role.ORGANIZER))),
+        )
+        fields = list(EVENT_READ_FIELDS)
+        if self.action != "list":
+            # Проверки прав по объекту читают денормализованное членство.
+            fields.extend(Event.MEMBERSHIP_FIELDS)
         return (
-            Event.objects.filter(Q(owner=user) | Q(participants__user=user))
+            _visible_events(user)
             .select_related("owner")
-            .prefetch_related("participants")
-            .distinct()
+            .only(*fields)
+            .annotate(viewer_role=viewer_role)
         )
 
     def get_serializer_class(
@@ -62,9 +100,9 @@ class EventViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        read_serializer = EventSerializer(
-            serializer.instance, context=self.get_serializer_context()
-        )
+        # Перечитываем тем же queryset: владелец и viewer_role приходят одним запросом.
+        event = self.get_queryset().get(pk=serializer.instance.pk)
+        read_serializer = EventSerializer(event, context=self.get_serializer_context())
         headers = self.get_success_headers(read_serializer.data)
         return Response(
             read_serializer.data, status=status.HTTP_201_CREATED, headers=headers
@@ -77,6 +115,7 @@ class EventViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
+        # Экземпляр из get_object() уже несёт владельца и аннотацию viewer_role.
         read_serializer = EventSerializer(
             serializer.instance, context=self.get_serializer_context()
         )
@@ -90,17 +129,13 @@ class EventViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer: EventCreateUpdateSerializer) -> None:
         """Проставляем владельца и создаём организатора-участника."""
         event = serializer.save(owner=self.request.user)
-        try:
-            Participant.objects.get_or_create(
-                event=event,
-                user=self.request.user,
-                defaults={"role": Participant.Role.ORGANIZER},
-            )
-        except IntegrityError:
-            # Если участник уже существует из-за гонки, просто обновим роль организатора.
-            Participant.objects.filter(event=event, user=self.request.user).update(
-                role=Participant.Role.ORGANIZER,
-            )
+        # Один INSERT ... ON CONFLICT DO UPDATE: при гонке роль просто станет организатором.
+        Participant.objects.bulk_create(
+            [Participant(event=event, user=self.request.user, role=Participant.Role.ORGANIZER)],
+            update_conflicts=True,
+            update_fields=["role"],
+            unique_fields=["user", "event"],
+        )
 
     def filter_queryset(self, queryset: QuerySet[Event]) -> QuerySet[Event]:
         """Дополнительно фильтруем по признаку будущих событий."""
@@ -108,29 +143,27 @@ class EventViewSet(viewsets.ModelViewSet):
         if self.action != "list":
             return queryset
 
-        upcoming_param = self.request.query_params.get("upcoming")
-        if upcoming_param is None:
-            return queryset
-
-        normalized = upcoming_param.lower()
-        if normalized not in {"true", "false"}:
+        upcoming = _UPCOMING_VALUES.get(
+            (self.request.query_params.get("upcoming") or "").lower()
+        )
+        if upcoming is None:
             return queryset
 
         now = timezone.now()
-        if normalized == "true":
+        if upcoming:
             return queryset.filter(start_at__gt=now)
         return queryset.filter(Q(start_at__lte=now) | Q(start_at__isnull=True))
 
     @action(detail=False, methods=["get"], url_path="categories")
     def categories(self, request: Request) -> Response:
         """Возвращает уникальные категории событий пользователя."""
+        # Отдельный узкий запрос: DISTINCT по одной колонке без владельца и viewer_role.
         categories_qs = (
-            self.get_queryset()
-            .exclude(category__isnull=True)
-            .exclude(category__exact="")
+            _visible_events(request.user)
+            .exclude(category="")
+            .order_by("category")
             .values_list("category", flat=True)
             .distinct()
-            .order_by("category")
         )
         return Response({"categories": list(categories_qs)})
 
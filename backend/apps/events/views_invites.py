@@ -3,8 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from django.db import transaction
-from django.db.models import F
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status
@@ -13,11 +13,28 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.events.models import Event, Invite, Participant
+from apps.events.mixins import EventCacheMixin
+from apps.events.models import Invite, Participant, hash_invite_token
 from apps.events.serializers import InviteCreateSerializer, InviteReadSerializer
+from apps.tasks.cache_utils import cache_safe_delete, cache_safe_get, cache_safe_set
 
 InviteStatus = Literal["ok", "expired", "revoked", "exhausted"]
 
+VALIDATE_CACHE_KEY_TEMPLATE = "invite:validate:{digest}"
+VALIDATE_CACHE_MAX_TTL_SECONDS = 30
+
+_NOT_FOUND_PAYLOAD = {
+    "status": "not_found",
+    "event": None,
+    "uses_left": None,
+    "expires_at": None,
+}
+
+
+def build_validate_cache_key(token_hash: bytes) -> str:
+    """Ключ кеша ответа проверки инвайта; токен в ключ не попадает в открытом виде."""
+    return VALIDATE_CACHE_KEY_TEMPLATE.format(digest=token_hash.hex())
+
 
 def _determine_status(invite: Invite, now: datetime) -> InviteStatus:
     """Возвращает статус инвайта относительно текущего времени."""
@@ -30,13 +47,13 @@ def _determine_status(invite: Invite, now: datetime) -> InviteStatus:
     return "ok"
 
 
-class EventInviteCreateView(APIView):
+class EventInviteCreateView(EventCacheMixin, APIView):
     """Создание инвайта владельцем события."""
 
     permission_classes = (IsAuthenticated,)
 
     def post(self, request: Request, event_id: int) -> Response:
-        event = get_object_or_404(Event, pk=event_id)
+        event = self.get_event()
         if event.owner_id != request.user.id:
             return Response(
                 {"detail": "Недостаточно прав для создания инвайта."},
@@ -48,7 +65,7 @@ class EventInviteCreateView(APIView):
             context={"event": event, "user": request.user},
         )
         serializer.is_valid(raise_exception=True)
-        invite = serializer.save()
+        invite = serializer.save(now=timezone.now())
         read_serializer = InviteReadSerializer(invite)
         return Response(read_serializer.data, status=status.HTTP_201_CREATED)
 
@@ -61,28 +78,20 @@ class ValidateInviteView(APIView):
     def get(self, request: Request) -> Response:
         token = request.query_params.get("token")
         if not token:
-            return Response(
-                {
-                    "status": "not_found",
-                    "event": None,
-                    "uses_left": None,
-                    "expires_at": None,
-                },
-                status=status.HTTP_200_OK,
-            )
+            return Response(_NOT_FOUND_PAYLOAD, status=status.HTTP_200_OK)
+
+        token_hash = hash_invite_token(token)
+        cache_key = build_validate_cache_key(token_hash)
+        cached_payload = cache_safe_get(cache_key)
+        if cached_payload is not None:
+            return Response(cached_payload, status=status.HTTP_200_OK)
 
         try:
-            invite = Invite.objects.select_related("event").get(token=token)
+            invite = Invite.objects.select_related("event").get(token_hash=token_hash)
         except Invite.DoesNotExist:
-            return Response(
-                {
-                    "status": "not_found",
-                    "event": None,
-                    "uses_left": None,
-                    "expires_at": None,
-                },
-                status=status.HTTP_200_OK,
-            )
+            # Кешируем и промахи, чтобы перебор токенов не доходил до базы.
+            cache_safe_set(cache_key, _NOT_FOUND_PAYLOAD, timeout=VALIDATE_CACHE_MAX_TTL_SECONDS)
+            return Response(_NOT_FOUND_PAYLOAD, status=status.HTTP_200_OK)
 
         now = timezone.now()
         status_code = _determine_status(invite, now)
@@ -105,6 +114,12 @@ class ValidateInviteView(APIView):
             "uses_left": uses_left,
             "expires_at": invite.expires_at.isoformat(),
         }
+        ttl = VALIDATE_CACHE_MAX_TTL_SECONDS
+        if status_code == "ok":
+            # Действующий инвайт не должен отдаваться из кеша после истечения срока.
+            seconds_left = int((invite.expires_at - now).total_seconds())
+            ttl = min(max(seconds_left, 1), VALIDATE_CACHE_MAX_TTL_SECONDS)
+        cache_safe_set(cache_key, response_payload, timeout=ttl)
         return Response(response_payload, status=status.HTTP_200_OK)
 
 
@@ -127,47 +142,54 @@ class AcceptInviteView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        token_hash = hash_invite_token(str(token))
         try:
-            initial_invite = Invite.objects.select_related("event").get(token=token)
+            initial_invite = Invite.objects.select_related("event").get(token_hash=token_hash)
         except Invite.DoesNotExist:
             return Response(
                 {"detail": "Инвайт не найден.", "code": "not_found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        with transaction.atomic():
-            invite = (
-                Invite.objects.select_for_update()
-                .select_related("event")
-                .get(pk=initial_invite.pk)
-            )
+        if request.user.id in initial_invite.event.participant_ids:
+            return Response({"message": "already_member"}, status=status.HTTP_200_OK)
 
-            already_member = Participant.objects.filter(
-                event=invite.event,
-                user=request.user,
-            ).exists()
-            if already_member:
-                return Response(
-                    {"message": "already_member"},
-                    status=status.HTTP_200_OK,
-                )
-
-            now = timezone.now()
+        now = timezone.now()
+        # Использование резервируется условным UPDATE без SELECT ... FOR UPDATE:
+        # одновременные участники не ждут друг друга на строке инвайта.
+        reservable = Invite.objects.filter(
+            Q(max_uses=0) | Q(uses_count__lt=F("max_uses")),
+            pk=initial_invite.pk,
+            is_revoked=False,
+            expires_at__gt=now,
+        )
+        try:
+            with transaction.atomic():
+                reserved = reservable.update(uses_count=F("uses_count") + 1)
+                if reserved:
+                    Participant.objects.create(
+                        event_id=initial_invite.event_id,
+                        user=request.user,
+                        role=Participant.Role.MEMBER,
+                    )
+        except IntegrityError:
+            # Участник появился параллельно; откат транзакции вернул и счётчик.
+            return Response({"message": "already_member"}, status=status.HTTP_200_OK)
+
+        if not reserved:
+            invite = Invite.objects.get(pk=initial_invite.pk)
             status_code = _determine_status(invite, now)
-            if status_code != "ok":
-                detail = self.ERROR_MESSAGES.get(status_code, "Инвайт недоступен.")
-                return Response(
-                    {"detail": detail, "code": status_code},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            Participant.objects.create(
-                event=invite.event,
-                user=request.user,
-                role=Participant.Role.MEMBER,
+            if status_code == "ok":
+                # Последнее использование занял параллельный запрос, откатившийся позже.
+                status_code = "exhausted"
+            detail = self.ERROR_MESSAGES.get(status_code, "Инвайт недоступен.")
+            return Response(
+                {"detail": detail, "code": status_code},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            Invite.objects.filter(pk=invite.pk).update(uses_count=F("uses_count") + 1)
 
+        # Остаток использований изменился: кешированный ответ проверки устарел.
+        cache_safe_delete(build_validate_cache_key(token_hash))
         return Response(
             {"message": "joined", "event_id": initial_invite.event_id},
             status=status.HTTP_201_CREATED,
@@ -187,9 +209,10 @@ class RevokeInviteView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        token_hash = hash_invite_token(str(token))
         invite = get_object_or_404(
             Invite.objects.select_related("event"),
-            token=token,
+            token_hash=token_hash,
         )
         if invite.event.owner_id != request.user.id:
             return Response(
@@ -200,5 +223,6 @@ class RevokeInviteView(APIView):
         if not invite.is_revoked:
             invite.is_revoked = True
             invite.save(update_fields=["is_revoked", "updated_at"])
+            cache_safe_delete(build_validate_cache_key(token_hash))
 
         return Response({"message": "revoked"}, status=status.HTTP_200_OK)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
-
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.pagination import PageNumberPagination
@@ -14,13 +12,28 @@ from rest_framework.response import Response
 from drf_spectacular.openapi import AutoSchema
 from rest_framework.views import APIView
 
-from apps.events.models import Event, Participant
+from apps.events.mixins import EventCacheMixin
+from apps.events.models import Participant
 from apps.events.permissions import IsEventOrganizer
 from apps.events.serializers import (
     ParticipantRoleUpdateSerializer,
     ParticipantSerializer,
 )
 
+# Колонки участника и пользователя, которые читает ``ParticipantSerializer``.
+PARTICIPANT_LIST_FIELDS = (
+    "id",
+    "role",
+    "joined_at",
+    "event",
+    "user",
+    "user__id",
+    "user__email",
+    "user__name",
+    "user__avatar",
+    "user__avatar_url",
+)
+
 
 class EventParticipantPagination(PageNumberPagination):
     page_size = 25
@@ -28,7 +41,7 @@ class EventParticipantPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class EventParticipantListView(generics.ListAPIView):
+class EventParticipantListView(EventCacheMixin, generics.ListAPIView):
     serializer_class = ParticipantSerializer
     pagination_class = EventParticipantPagination
     permission_classes = [IsAuthenticated, IsEventOrganizer]
@@ -39,14 +52,6 @@ class EventParticipantListView(generics.ListAPIView):
         "role": "role",
     }
 
-    def get_event(self) -> Event:
-        if not hasattr(self, "_event"):
-            event = get_object_or_404(Event.objects.all(), pk=self.kwargs["event_id"])
-            self._event = event
-        event = self._event  # type: ignore[attr-defined]
-        self.check_object_permissions(self.request, event)
-        return event
-
     def _resolve_ordering(self, raw_value: str) -> list[str]:
         if not raw_value:
             return ["user__name"]
@@ -73,6 +78,7 @@ class EventParticipantListView(generics.ListAPIView):
         return (
             Participant.objects.filter(event=event)
             .select_related("user")
+            .only(*PARTICIPANT_LIST_FIELDS)
             .order_by(*order_fields, "id")
         )
 
@@ -82,33 +88,29 @@ class EventParticipantListView(generics.ListAPIView):
         return context
 
 
-class EventParticipantDetailView(APIView):
+class EventParticipantDetailView(EventCacheMixin, APIView):
     permission_classes = [IsAuthenticated, IsEventOrganizer]
     schema = AutoSchema()
 
-    def get_event(self) -> Event:
-        if not hasattr(self, "_event"):
-            event = get_object_or_404(Event.objects.all(), pk=self.kwargs["event_id"])
-            self._event = event
-        event = self._event  # type: ignore[attr-defined]
-        self.check_object_permissions(self.request, event)
-        return event
-
     def get_participant(self) -> Participant:
         event = self.get_event()
         participant = get_object_or_404(
-            Participant.objects.select_related("user"),
+            Participant.objects.select_related("user").only(*PARTICIPANT_LIST_FIELDS),
             event=event,
             pk=self.kwargs["participant_id"],
         )
-        self.check_object_permissions(self.request, participant)
+        # Участник выбран в рамках уже проверенного события: повторная проверка прав
+        # не нужна, а событие подставляется без отдельного запроса.
+        participant.event = event
         return participant
 
-    def _other_organizers_exist(self, event: Event, exclude: Iterable[int]) -> bool:
-        qs = Participant.objects.filter(event=event, role=Participant.Role.ORGANIZER)
-        if exclude:
-            qs = qs.exclude(pk__in=list(exclude))
-        return qs.exists()
+    def _count_others(self, participant: Participant) -> dict[str, int]:
+        """Другие организаторы и другие участники события одним запросом."""
+        others = ~Q(pk=participant.pk)
+        return Participant.objects.filter(event_id=participant.event_id).aggregate(
+            organizers=Count("pk", filter=Q(role=Participant.Role.ORGANIZER) & others),
+            participants=Count("pk", filter=others),
+        )
 
     def _error(
         self, code: str, detail: str, *, status_code: int = status.HTTP_400_BAD_REQUEST
@@ -149,17 +151,11 @@ class EventParticipantDetailView(APIView):
             participant.role == Participant.Role.ORGANIZER
             and new_role != Participant.Role.ORGANIZER
         ):
-            other_exists = self._other_organizers_exist(
-                participant.event, {participant.pk}
-            )
+            others = self._count_others(participant)
+            other_exists = others["organizers"] > 0
             if participant.user_id == request.user.id and not other_exists:
-                has_other_participants = participant.event.participants.exclude(
-                    pk=participant.pk
-                ).exists()
                 return self._error(
-                    "self_last_organizer"
-                    if has_other_participants
-                    else "last_organizer",
+                    "self_last_organizer" if others["participants"] else "last_organizer",
                     "Cannot change your role because you are the only organizer.",
                 )
             if not other_exists:
@@ -180,9 +176,7 @@ class EventParticipantDetailView(APIView):
     def delete(self, request: Request, event_id: int, participant_id: int) -> Response:
         participant = self.get_participant()
         if participant.role == Participant.Role.ORGANIZER:
-            other_exists = self._other_organizers_exist(
-                participant.event, {participant.pk}
-            )
+            other_exists = self._count_others(participant)["organizers"] > 0
             if participant.user_id == request.user.id and not other_exists:
                 return self._error(
                     "last_organizer",
@@ -7,3 +7,13 @@ class ExportConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.export"
     verbose_name = "Экспорт планов событий"
+
+    def ready(self) -> None:
+        from .services import _ensure_fonts
+
+        # Шрифты регистрируются при старте процесса, а не при первом отчёте.
+        try:
+            _ensure_fonts()
+        except RuntimeError:
+            # Без reportlab экспорт недоступен, но приложение должно загружаться.
+            pass
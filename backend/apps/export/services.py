@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Final, TYPE_CHECKING
+from typing import Any, BinaryIO, Final, NamedTuple, TYPE_CHECKING
 
 from django.conf import settings
-from django.db.models import Prefetch, QuerySet
+from django.db.models import QuerySet
 from django.utils import timezone
 
 try:
@@ -33,7 +33,7 @@ else:  # pragma: no cover - подсказки типов не нужны во 
     Canvas = Any  # type: ignore[assignment]
 
 from apps.events.models import Event
-from apps.tasks.models import Task, TaskList
+from apps.tasks.models import Task
 
 _FONT_CANDIDATES_REGULAR: Final[list[Path]] = [
     Path(settings.BASE_DIR) / "apps" / "export" / "fonts" / "Roboto-Regular.ttf",
@@ -56,14 +56,20 @@ _FONT_CANDIDATES_BOLD: Final[list[Path]] = [
     Path(r"C:\Windows\Fonts\arialbd.ttf"),
 ]
 
+_FONT_LOCK = threading.Lock()
 _FONT_REGULAR_NAME: str | None = None
 _FONT_BOLD_NAME: str | None = None
 
 _TABLE_ROW_HEIGHT: Final[float] = 18.0
+_TASK_CHUNK_SIZE: Final[int] = 500
+_DATETIME_FORMAT: Final[str] = "%d.%m.%Y %H:%M"
+_STATUS_LABELS: Final[dict[str, str]] = dict(Task.Status.choices)
 
+# До этого размера отчёт держится в памяти, крупнее — уходит во временный файл.
+PDF_SPOOL_MAX_BYTES: Final[int] = 1024 * 1024
 
-@dataclass(frozen=True)
-class _TaskSnapshot:
+
+class _TaskSnapshot(NamedTuple):
     """Снимок задачи с данными, необходимыми для отчёта."""
 
     id: int
@@ -83,6 +89,14 @@ def _register_font(font_name: str, path: Path) -> bool:
         return False
 
 
+def _resolve_font(font_name: str, candidates: list[Path], fallback: str) -> str:
+    """Регистрирует первый доступный шрифт из списка или возвращает встроенный."""
+    for candidate in candidates:
+        if candidate.is_file() and _register_font(font_name, candidate):
+            return font_name
+    return fallback
+
+
 def _ensure_fonts() -> tuple[str, str]:
     """Готовит шрифты для кириллического текста с запасным вариантом."""
     if not _REPORTLAB_AVAILABLE:
@@ -94,74 +108,66 @@ def _ensure_fonts() -> tuple[str, str]:
     if _FONT_REGULAR_NAME and _FONT_BOLD_NAME:
         return _FONT_REGULAR_NAME, _FONT_BOLD_NAME
 
-    for candidate in _FONT_CANDIDATES_REGULAR:
-        if candidate.is_file() and _register_font("ExportPrimary", candidate):
-            _FONT_REGULAR_NAME = "ExportPrimary"
-            break
-    else:
-        _FONT_REGULAR_NAME = "Helvetica"
-
-    for candidate in _FONT_CANDIDATES_BOLD:
-        if candidate.is_file() and _register_font("ExportPrimary-Bold", candidate):
-            _FONT_BOLD_NAME = "ExportPrimary-Bold"
-            break
-    else:
-        _FONT_BOLD_NAME = "Helvetica-Bold"
+    # Параллельные потоки воркера не должны регистрировать шрифты дважды.
+    with _FONT_LOCK:
+        if _FONT_REGULAR_NAME is None:
+            _FONT_REGULAR_NAME = _resolve_font(
+                "ExportPrimary", _FONT_CANDIDATES_REGULAR, "Helvetica"
+            )
+        if _FONT_BOLD_NAME is None:
+            _FONT_BOLD_NAME = _resolve_font(
+                "ExportPrimary-Bold", _FONT_CANDIDATES_BOLD, "Helvetica-Bold"
+            )
 
     return _FONT_REGULAR_NAME, _FONT_BOLD_NAME
 
 
-def _event_queryset() -> QuerySet[Event]:
-    """Формирует запрос события с задачами и зависимостями."""
-    task_queryset = (
-        Task.objects.select_related("assignee__user", "list")
-        .prefetch_related("depends_on")
-        .order_by("list__order", "list_id", "order", "id")
-    )
+def _task_queryset(event_id: int) -> QuerySet[Task]:
+    """Задачи события в порядке отчёта с колонками, нужными для таблицы."""
     return (
-        Event.objects.select_related("owner")
-        .prefetch_related(
-            Prefetch(
-                "task_lists",
-                queryset=TaskList.objects.order_by("order", "id").prefetch_related(
-                    Prefetch("tasks", queryset=task_queryset)
-                ),
-            )
+        Task.objects.filter(list__event_id=event_id)
+        .select_related("assignee__user", "list")
+        .only(
+            "id",
+            "title",
+            "status",
+            "due_at",
+            "list",
+            "list__title",
+            "assignee",
+            "assignee__user",
+            "assignee__user__name",
+            "assignee__user__email",
         )
-        .only("id", "title", "owner_id")
+        .order_by("list__order", "list_id", "order", "id")
     )
 
 
-def _format_datetime(value: datetime | None) -> str:
-    """Приводит дату к строке вида 31.12.2025 14:30."""
-    if value is None:
-        return "—"
-    localized = timezone.localtime(value) if timezone.is_aware(value) else value
-    return localized.strftime("%d.%m.%Y %H:%M")
-
-
-def _build_snapshots(tasks: Iterable[Task]) -> list[_TaskSnapshot]:
-    """Собирает удобные для отрисовки представления задач."""
-    snapshots: list[_TaskSnapshot] = []
+def _iter_snapshots(tasks: Iterable[Task]) -> Iterator[_TaskSnapshot]:
+    """Лениво превращает задачи в удобные для отрисовки представления."""
+    # Часовой пояс и справочник статусов не меняются в пределах одного отчёта.
+    tz = timezone.get_current_timezone()
+    status_labels = _STATUS_LABELS
     for task in tasks:
         assignee = getattr(task.assignee, "user", None)
         assignee_name = getattr(assignee, "name", None) or getattr(
             assignee, "email", "—"
         )
-        status_label = task.get_status_display()
-        due_date = _format_datetime(task.due_at)
-        list_title = task.list.title
-        snapshots.append(
-            _TaskSnapshot(
-                id=task.id,
-                title=task.title,
-                list_title=list_title,
-                assignee_name=assignee_name,
-                status_label=status_label,
-                due_date=due_date,
-            )
+        due_at = task.due_at
+        if due_at is None:
+            due_date = "—"
+        else:
+            if due_at.tzinfo is not None:
+                due_at = due_at.astimezone(tz)
+            due_date = due_at.strftime(_DATETIME_FORMAT)
+        yield _TaskSnapshot(
+            id=task.id,
+            title=task.title,
+            list_title=task.list.title,
+            assignee_name=assignee_name,
+            status_label=status_labels.get(task.status, task.status),
+            due_date=due_date,
         )
-    return snapshots
 
 
 def _truncate(text: str, limit: int) -> str:
@@ -198,7 +204,7 @@ def _draw_header(
 def _draw_table(
     pdf: Canvas,
     start_y: float,
-    snapshots: list[_TaskSnapshot],
+    snapshots: Iterable[_TaskSnapshot],
     font_regular: str,
     font_bold: str,
     event_title: str,
@@ -247,28 +253,33 @@ def _draw_table(
     return y
 
 
-def generate_event_pdf(event_id: int) -> bytes:
-    """Генерирует PDF-отчёт по задачам события."""
+def write_event_pdf(event_id: int, output: BinaryIO) -> None:
+    """Записывает PDF-отчёт по задачам события в переданный двоичный поток."""
     if not _REPORTLAB_AVAILABLE:
         raise RuntimeError(
             "ReportLab недоступен. Установите пакет reportlab, чтобы формировать PDF-отчёты."
         )
-    event = _event_queryset().get(id=event_id)
-    all_tasks: list[Task] = []
-    for task_list in event.task_lists.all():
-        all_tasks.extend(task_list.tasks.all())
-
-    snapshots = _build_snapshots(all_tasks)
+    # Для шапки нужен только заголовок: без экземпляра модели.
+    event_title = Event.objects.filter(id=event_id).values_list("title", flat=True).get()
+    # Задачи читаются порциями и рисуются по мере чтения, без списка всех задач в памяти.
+    snapshots = _iter_snapshots(
+        _task_queryset(event_id).iterator(chunk_size=_TASK_CHUNK_SIZE)
+    )
     font_regular, font_bold = _ensure_fonts()
 
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
+    pdf = canvas.Canvas(output, pagesize=A4)
 
     generated_at = timezone.now()
-    header_y = _draw_header(pdf, event.title, generated_at, font_regular, font_bold)
+    header_y = _draw_header(pdf, event_title, generated_at, font_regular, font_bold)
     _draw_table(
-        pdf, header_y, snapshots, font_regular, font_bold, event.title, generated_at
+        pdf, header_y, snapshots, font_regular, font_bold, event_title, generated_at
     )
 
     pdf.save()
+
+
+def generate_event_pdf(event_id: int) -> bytes:
+    """Генерирует PDF-отчёт по задачам события."""
+    buffer = BytesIO()
+    write_event_pdf(event_id, buffer)
     return buffer.getvalue()
@@ -3,9 +3,11 @@ from __future__ import annotations
 import codecs
 from datetime import timedelta
 from io import BytesIO
+from typing import Iterator, NamedTuple
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -30,7 +32,15 @@ def _auth_client(user: User) -> APIClient:
     return client
 
 
-def _create_event_with_data() -> tuple[Event, User, Task, Poll, PollOption]:
+class ExportData(NamedTuple):
+    event: Event
+    owner: User
+    task: Task
+    poll: Poll
+    option: PollOption
+
+
+def _create_event_with_data() -> ExportData:
     """Создаёт событие с задачами и опросами для проверки экспорта."""
 
     owner = User.objects.create_user(email="owner@export.test", password="Password123")
@@ -62,11 +72,29 @@ def _create_event_with_data() -> tuple[Event, User, Task, Poll, PollOption]:
     poll_option = PollOption.objects.create(poll=poll, label="18:00")
     Vote.objects.create(poll=poll, option=poll_option, user=owner)
 
-    return event, owner, task, poll, poll_option
+    return ExportData(event, owner, task, poll, poll_option)
+
+
+@pytest.fixture(scope="module")
+def export_data(django_db_setup, django_db_blocker) -> Iterator[ExportData]:
+    """Данные экспорта создаются один раз на модуль: тесты их только читают.
+
+    Как ``setUpTestData`` в ``TestCase``: данные живут во внешней транзакции,
+    которая откатывается после модуля, а тесты работают во вложенных точках сохранения.
+    """
+
+    with django_db_blocker.unblock(), transaction.atomic():
+        yield _create_event_with_data()
+        transaction.set_rollback(True)
 
 
-def test_event_export_csv_returns_utf8_bom_and_contains_data() -> None:
-    event, owner, task, poll, poll_option = _create_event_with_data()
+@pytest.fixture()
+def outsider() -> User:
+    return User.objects.create_user(email="outsider@export.test", password="Password123")
+
+
+def test_event_export_csv_returns_utf8_bom_and_contains_data(export_data: ExportData) -> None:
+    event, owner, task, poll, poll_option = export_data
 
     client = _auth_client(owner)
     response = client.get(f"/api/events/{event.id}/export/csv")
@@ -86,8 +114,10 @@ def test_event_export_csv_returns_utf8_bom_and_contains_data() -> None:
     assert poll_option.label and poll_option.label in decoded
 
 
-def test_event_export_xls_loads_with_openpyxl_and_contains_data() -> None:
-    event, owner, task, poll, poll_option = _create_event_with_data()
+def test_event_export_xls_loads_with_openpyxl_and_contains_data(
+    export_data: ExportData,
+) -> None:
+    event, owner, task, poll, poll_option = export_data
 
     client = _auth_client(owner)
     response = client.get(f"/api/events/{event.id}/export/xls")
@@ -117,13 +147,10 @@ def test_event_export_xls_loads_with_openpyxl_and_contains_data() -> None:
     assert poll_option.label in option_labels
 
 
-def test_event_export_csv_forbidden_for_non_participant() -> None:
-    event, owner, *_ = _create_event_with_data()
-    outsider = User.objects.create_user(
-        email="outsider@export.test", password="Password123"
-    )
-
+def test_event_export_csv_forbidden_for_non_participant(
+    export_data: ExportData, outsider: User
+) -> None:
     client = _auth_client(outsider)
-    response = client.get(f"/api/events/{event.id}/export/csv")
+    response = client.get(f"/api/events/{export_data.event.id}/export/csv")
 
     assert response.status_code == 403
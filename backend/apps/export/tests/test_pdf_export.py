@@ -69,7 +69,7 @@ def test_event_pdf_export_view_returns_pdf_response() -> None:
         response["Content-Disposition"]
         == f'attachment; filename="event_{event.id}_plan.pdf"'
     )
-    assert event.title.encode("utf-8") in response.content
+    assert event.title.encode("utf-8") in b"".join(response.streaming_content)
 
 
 def test_event_pdf_export_view_denies_non_participant() -> None:
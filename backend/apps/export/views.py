@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from tempfile import SpooledTemporaryFile
 from typing import Any, Tuple
 
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import exceptions, status
 from rest_framework.negotiation import BaseContentNegotiation
@@ -12,8 +13,8 @@ from rest_framework.response import Response
 from drf_spectacular.openapi import AutoSchema
 from rest_framework.views import APIView
 
-from apps.events.models import Event, Participant
-from apps.export.services import generate_event_pdf
+from apps.events.models import Event
+from apps.export.services import PDF_SPOOL_MAX_BYTES, write_event_pdf
 from apps.export.utils import generate_event_csv, generate_event_xls
 
 
@@ -30,19 +31,15 @@ def _fetch_event_and_membership(event_id: int, user: Any) -> Tuple[Event, bool]:
     """Возвращает событие и флаг доступа, если пользователь участвует в нём."""
 
     event = get_object_or_404(
-        Event.objects.only("id", "title", "owner_id"), id=event_id
+        Event.objects.only("id", "title", "owner_id", "participant_ids"), id=event_id
     )
 
     if not getattr(user, "is_authenticated", False):
         return event, False
-    if event.owner_id == getattr(user, "id", None):
+    user_id = getattr(user, "id", None)
+    if event.owner_id == user_id:
         return event, True
-    is_participant = (
-        Participant.objects.filter(event_id=event.id, user=user)
-        .values_list("id", flat=True)
-        .exists()
-    )
-    return event, is_participant
+    return event, user_id in event.participant_ids
 
 
 class EventPdfExportView(APIView):
@@ -52,17 +49,25 @@ class EventPdfExportView(APIView):
     content_negotiation_class = IgnoreAcceptContentNegotiation
     schema = AutoSchema()
 
-    def get(self, request: Request, event_id: int) -> HttpResponse | Response:
+    def get(self, request: Request, event_id: int) -> FileResponse | Response:
         event, allowed = _fetch_event_and_membership(event_id, request.user)
         if not allowed:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-        pdf_bytes = generate_event_pdf(event.id)
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
-        response["Content-Disposition"] = (
-            f'attachment; filename="event_{event.id}_plan.pdf"'
+        # Отчёт пишется в спул-файл и отдаётся потоком: крупный PDF не копируется в bytes.
+        pdf_file = SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES, mode="w+b")
+        try:
+            write_event_pdf(event.id, pdf_file)
+        except BaseException:
+            pdf_file.close()
+            raise
+        pdf_file.seek(0)
+        return FileResponse(
+            pdf_file,
+            as_attachment=True,
+            filename=f"event_{event.id}_plan.pdf",
+            content_type="application/pdf",
         )
-        return response
 
 
 class EventExportCSVView(APIView):
@@ -6,7 +6,7 @@ from typing import Any
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
-from apps.utils.ws import ensure_group_name_regex_allows_colon
+from apps.utils.ws import build_broadcast_message
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +26,6 @@ def ws_notify_event(event_id: int, message_type: str, payload: dict[str, Any]) -
         )
         return
 
-    ensure_group_name_regex_allows_colon(channel_layer)
     async_to_sync(channel_layer.group_send)(
-        f"event:{event_id}",
-        {
-            "type": "broadcast",
-            "message_type": message_type,
-            "payload": payload,
-        },
+        f"event:{event_id}", build_broadcast_message(message_type, payload)
     )
@@ -61,6 +61,16 @@ def cache_safe_set(key: str, value: object, timeout: int | None = None) -> None:
         _fallback_set(key, value, timeout)
 
 
+def cache_safe_add(key: str, value: object, timeout: int | None = None) -> bool:
+    try:
+        return bool(cache.add(key, value, timeout=timeout))
+    except _CACHE_ERRORS:
+        if _fallback_get(key) is not None:
+            return False
+        _fallback_set(key, value, timeout)
+        return True
+
+
 def cache_safe_delete(key: str) -> None:
     try:
         cache.delete(key)
@@ -585,13 +585,11 @@ class EventProgressView(APIView):
         return event_id
 
     def get(self, request: Request, event_id: int) -> Response:
-        event = get_object_or_404(Event.objects.only("id", "owner_id"), id=event_id)
-        if event.owner_id != request.user.id:
-            is_participant = Participant.objects.filter(
-                event=event, user=request.user
-            ).exists()
-            if not is_participant:
-                return Response(status=status.HTTP_403_FORBIDDEN)
+        event = get_object_or_404(
+            Event.objects.only("id", "owner_id", "participant_ids"), id=event_id
+        )
+        if event.owner_id != request.user.id and request.user.id not in event.participant_ids:
+            return Response(status=status.HTTP_403_FORBIDDEN)
 
         cached_payload = get_cached_progress(event_id)
         if cached_payload is not None:
@@ -7,6 +7,7 @@ from uuid import uuid4
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone as django_timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -93,6 +94,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         indexes = [
             models.Index(fields=["email"], name="idx_user_email"),
         ]
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_uniq"),
+        ]
 
     def __str__(self) -> str:
         return self.email
+
+
+# ``email__lower`` только для User.email: поиск попадает в индекс ``user_email_ci_uniq``.
+User._meta.get_field("email").register_lookup(Lower)
@@ -3,16 +3,40 @@ from __future__ import annotations
 import re
 from typing import Any
 
+import orjson
 
-def ensure_group_name_regex_allows_colon(channel_layer: Any) -> None:
+_GROUP_NAME_WITH_COLON_REGEX = re.compile(r"^[\w\-.:]+$")
+
+
+def allow_colon_in_group_names() -> None:
+    """
+    Разрешает двоеточие в именах групп на уровне ``BaseChannelLayer`` один раз при старте.
+
+    Так его наследуют все экземпляры слоёв, в том числе пересозданные после смены
+    ``CHANNEL_LAYERS``, и проверка не нужна на каждом подключении.
+    """
+
+    from channels.layers import BaseChannelLayer
+
+    if ":" not in BaseChannelLayer.group_name_regex.pattern:
+        BaseChannelLayer.group_name_regex = _GROUP_NAME_WITH_COLON_REGEX
+
+
+def build_broadcast_message(
+    message_type: str, payload: dict[str, Any], **extra: Any
+) -> dict[str, Any]:
     """
-    Channels ограничивает состав символов в именах групп.
-    Разрешаем использование двоеточия для шаблона event:<id>.
+    Собирает сообщение channel layer для ``EventConsumer.broadcast``.
+
+    Кадр ``{"type", "payload"}`` кодируется один раз у отправителя: получатели
+    пересылают готовую строку ``frame`` и сверяют лимит по ``frame_size`` (байты UTF-8).
     """
 
-    pattern = getattr(channel_layer, "group_name_regex", None)
-    if pattern is None or not hasattr(pattern, "pattern"):
-        return
-    if ":" in getattr(pattern, "pattern", ""):
-        return
-    channel_layer.group_name_regex = re.compile(r"^[\w\-.:]+$")
+    encoded = orjson.dumps({"type": message_type, "payload": payload})
+    return {
+        "type": "broadcast",
+        "message_type": message_type,
+        "frame": encoded.decode("utf-8"),
+        "frame_size": len(encoded),
+        **extra,
+    }
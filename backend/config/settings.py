@@ -183,6 +183,8 @@ DEFAULT_FROM_EMAIL = env(
 )
 SITE_URL: str = env("SITE_URL", default="http://localhost:3000")
 SITE_FRONT_URL: str = env("SITE_FRONT_URL", default=SITE_URL)
+# Канонический origin API для абсолютных ссылок на медиа; пусто — брать из запроса.
+ABSOLUTE_URI_BASE: str = env("ABSOLUTE_URI_BASE", default="")
 
 
 # Static files (CSS, JavaScript, Images)
@@ -6,6 +6,7 @@ import pytest
 from django.core import mail
 from django.test.utils import override_settings
 
+from apps.auth.serializers import RegistrationSerializer
 from apps.auth.utils import EmailConfirmationTokenError, make_email_confirmation_token
 from apps.users.models import User
 
@@ -39,6 +40,38 @@ def test_register_sends_email_and_creates_inactive_user(client) -> None:
     assert email.to == ["new_user@example.com"]
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("email", "is_valid"),
+    [
+        ("user@localhost", True),
+        ("user@example.com", True),
+        ("user", False),
+        ("user@ex ample.com", False),
+    ],
+)
+def test_registration_email_precheck_matches_email_validator(email: str, is_valid: bool) -> None:
+    serializer = RegistrationSerializer(data={"email": email, "password": "Password123"})
+    serializer.is_valid()
+    assert ("email" not in serializer.errors) is is_valid
+
+
+@pytest.mark.django_db
+def test_register_rejects_duplicate_email_case_insensitive(client) -> None:
+    User.objects.create_user(email="taken@example.com", password="Password123")
+
+    response = _post_json(
+        client,
+        "/api/auth/register",
+        {"email": "Taken@Example.com", "password": "Password123"},
+    )
+
+    assert response.status_code == 400
+    payload = response.json()
+    assert payload["detail"] == "Пользователь с таким email уже зарегистрирован."
+    assert User.objects.filter(email__iexact="taken@example.com").count() == 1
+
+
 @pytest.mark.django_db
 @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
 def test_resend_confirmation_sends_email(client) -> None:
@@ -87,6 +120,23 @@ def test_confirm_activates_user_valid_token(client) -> None:
     assert user.is_active is True
 
 
+@pytest.mark.django_db
+def test_confirm_is_idempotent_for_active_user(client) -> None:
+    user = User.objects.create_user(
+        email="active@example.com", password="Password123", is_active=True
+    )
+    token = make_email_confirmation_token(user.pk)
+
+    response = client.get(f"/api/auth/confirm?token={token}")
+    assert response.status_code == 200
+    assert response.json() == {"message": "email_confirmed"}
+
+    user.delete()
+    missing_response = client.get(f"/api/auth/confirm?token={token}")
+    assert missing_response.status_code == 400
+    assert missing_response.json()["token"][0] == "Пользователь не найден."
+
+
 @pytest.mark.django_db
 def test_confirm_rejects_expired_or_bad_token(client, monkeypatch) -> None:
     bad_response = client.get("/api/auth/confirm")
@@ -212,3 +212,14 @@ def test_categories_endpoint_returns_unique_sorted_categories() -> None:
     assert payload == {
         "categories": ["community", "meetup", "workshop"],
     }
+
+
+def test_missing_event_returns_404() -> None:
+    """Несуществующее событие отдаёт 404, а не 403."""
+    user = User.objects.create_user(email="ghost@example.com", password="Password123")
+    client = _auth_client(user)
+    missing_id = (Event.objects.order_by("-id").values_list("id", flat=True).first() or 0) + 1
+
+    assert client.get(f"/api/events/{missing_id}/").status_code == 404
+    response = client.patch(f"/api/events/{missing_id}/", data={"title": "X"}, format="json")
+    assert response.status_code == 404
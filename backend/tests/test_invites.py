@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -188,6 +189,57 @@ def test_accept_invite_when_already_member_returns_already_member() -> None:
     assert invite.uses_count == 1
 
 
+def test_accept_exhausted_invite_does_not_reserve_use() -> None:
+    """Исчерпанный инвайт отклоняется, участник не создаётся, счетчик не меняется."""
+    owner = User.objects.create_user(email="owner3@example.com", password="Password123")
+    latecomer = User.objects.create_user(
+        email="late@example.com", password="Password123"
+    )
+    event = Event.objects.create(owner=owner, title="Full Event")
+    invite = Invite.objects.create(
+        event=event,
+        created_by=owner,
+        expires_at=timezone.now() + timedelta(hours=2),
+        max_uses=1,
+        uses_count=1,
+    )
+
+    client = _auth_client(latecomer)
+    response = client.post(
+        "/api/invites/accept", data={"token": invite.token}, format="json"
+    )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "exhausted"
+    assert not Participant.objects.filter(event=event, user=latecomer).exists()
+    invite.refresh_from_db()
+    assert invite.uses_count == 1
+
+
+def test_accept_lost_reservation_race_reports_exhausted(monkeypatch) -> None:
+    """Проигранная гонка за последнее использование не отдаёт код ``ok`` с ошибкой 400."""
+    owner = User.objects.create_user(email="owner6@example.com", password="Password123")
+    racer = User.objects.create_user(email="racer@example.com", password="Password123")
+    event = Event.objects.create(owner=owner, title="Race Event")
+    invite = Invite.objects.create(
+        event=event,
+        created_by=owner,
+        expires_at=timezone.now() + timedelta(hours=2),
+        max_uses=1,
+    )
+    # Условный UPDATE не находит строку, хотя перечитанный инвайт выглядит доступным.
+    monkeypatch.setattr(QuerySet, "update", lambda self, **kwargs: 0)
+
+    client = _auth_client(racer)
+    response = client.post(
+        "/api/invites/accept", data={"token": invite.token}, format="json"
+    )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "exhausted"
+    assert not Participant.objects.filter(event=event, user=racer).exists()
+
+
 def test_non_owner_cannot_revoke_others_invite() -> None:
     """Только владелец события может отзывать инвайт."""
     owner = User.objects.create_user(
@@ -221,3 +273,23 @@ def test_non_owner_cannot_revoke_others_invite() -> None:
 
     invite.refresh_from_db()
     assert invite.is_revoked is True
+
+
+def test_validate_invite_reflects_revoke_despite_cache() -> None:
+    """После отзыва проверка инвайта не отдаёт закешированный статус ok."""
+    owner = User.objects.create_user(email="cacher@example.com", password="Password123")
+    event = Event.objects.create(owner=owner, title="Cached Event")
+    invite = Invite.objects.create(
+        event=event,
+        created_by=owner,
+        expires_at=timezone.now() + timedelta(hours=4),
+    )
+
+    client = _auth_client(owner)
+    first = client.get("/api/invites/validate", {"token": invite.token})
+    assert first.json()["status"] == "ok"
+
+    client.post("/api/invites/revoke", data={"token": invite.token}, format="json")
+
+    second = client.get("/api/invites/validate", {"token": invite.token})
+    assert second.json()["status"] == "revoked"
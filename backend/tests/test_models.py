@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.utils import timezone
 
-from apps.events.models import Event, Participant
+from apps.events.models import Event, Invite, Participant, hash_invite_token
+from apps.events.serializers import EventCreateUpdateSerializer
 from apps.users.models import User
 
 
@@ -59,3 +62,100 @@ def test_participant_constraints() -> None:
     participant = Participant(user=member, event=event, role="invalid")  # type: ignore[arg-type]
     with pytest.raises(ValidationError):
         participant.full_clean()
+
+
+@pytest.mark.django_db()
+def test_event_membership_ids_follow_participants() -> None:
+    """Денормализованные id участников и организаторов синхронизируются сигналами."""
+    owner = User.objects.create_user(email="owner3@example.com", password="password123")
+    member = User.objects.create_user(email="member3@example.com", password="password123")
+    event = Event.objects.create(owner=owner, title="Synced Event")
+
+    Participant.objects.create(user=owner, event=event, role=Participant.Role.ORGANIZER)
+    participant = Participant.objects.create(
+        user=member, event=event, role=Participant.Role.MEMBER
+    )
+    event.refresh_from_db()
+    assert sorted(event.participant_ids) == sorted([owner.id, member.id])
+    assert event.organizer_ids == [owner.id]
+
+    participant.role = Participant.Role.ORGANIZER
+    participant.save()
+    event.refresh_from_db()
+    assert sorted(event.organizer_ids) == sorted([owner.id, member.id])
+
+    stale_event = Event.objects.get(pk=event.pk)
+    participant.delete()
+    serializer = EventCreateUpdateSerializer(stale_event, data={"title": "Renamed"}, partial=True)
+    assert serializer.is_valid(), serializer.errors
+    serializer.save()
+    event.refresh_from_db()
+    assert event.title == "Renamed"
+    assert event.participant_ids == [owner.id]
+    assert event.organizer_ids == [owner.id]
+
+
+@pytest.mark.django_db()
+def test_event_membership_ids_follow_writes_that_skip_signals() -> None:
+    """Триггеры базы держат массивы членства в актуальном виде и без сигналов Django."""
+    owner = User.objects.create_user(email="owner5@example.com", password="password123")
+    member = User.objects.create_user(email="member5@example.com", password="password123")
+    event = Event.objects.create(owner=owner, title="Trigger Event")
+    stale_event = Event.objects.get(pk=event.pk)
+
+    Participant.objects.bulk_create(
+        [
+            Participant(user=owner, event=event, role=Participant.Role.ORGANIZER),
+            Participant(user=member, event=event, role=Participant.Role.MEMBER),
+        ]
+    )
+    Participant.objects.filter(event=event, user=member).update(role=Participant.Role.ORGANIZER)
+    event.refresh_from_db()
+    assert event.participant_ids == sorted([owner.id, member.id])
+    assert event.organizer_ids == sorted([owner.id, member.id])
+
+    # Полное сохранение устаревшего экземпляра не перетирает массивы.
+    stale_event.save()
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM events_participant WHERE user_id = %s", [member.id])
+    event.refresh_from_db()
+    assert event.participant_ids == [owner.id]
+    assert event.organizer_ids == [owner.id]
+
+
+@pytest.mark.django_db()
+def test_invite_is_found_by_token_hash() -> None:
+    """Хеш токена заполняется при сохранении и находит инвайт."""
+    owner = User.objects.create_user(email="owner4@example.com", password="password123")
+    event = Event.objects.create(owner=owner, title="Hashed Event")
+    invite = Invite.objects.create(
+        event=event,
+        created_by=owner,
+        expires_at=timezone.now() + timedelta(hours=1),
+    )
+
+    found = Invite.objects.get(token_hash=hash_invite_token(invite.token))
+    assert found.pk == invite.pk
+
+    # Хеш выставляет база, поэтому он верен и для записей в обход save().
+    Invite.objects.filter(pk=invite.pk).update(token="rotated-token")
+    assert Invite.objects.get(token_hash=hash_invite_token("rotated-token")).pk == invite.pk
+    Invite.objects.bulk_create(
+        [
+            Invite(
+                event=event,
+                created_by=owner,
+                token="bulk-token",
+                expires_at=timezone.now() + timedelta(hours=1),
+            )
+        ]
+    )
+    assert Invite.objects.filter(token_hash=hash_invite_token("bulk-token")).exists()
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Invite.objects.create(
+            event=event,
+            created_by=owner,
+            token="bulk-token",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )